@@ -0,0 +1,31 @@
+from .annealing import ParallelTempering, SimulatedAnnealing, annealing_chains, parallel_tempering, simulated_annealing
+from .ant_colony import AntColonySystem
+from .bees import BeesAlgorithm
+from .benchmarks import (
+    BOUNDS,
+    ALL_FUNCTIONS,
+    FUNCTIONS,
+    LAB_VARIANTS,
+    ackley,
+    as_batch,
+    drop_wave,
+    griewank,
+    holder_table,
+    langermann,
+    levy,
+    michalewicz,
+    schwefel,
+    zakharov,
+)
+from .bfoa import BacterialForagingOptimization
+from .checkpoint import load_checkpoint, resume, save_checkpoint
+from .evaluation import AsyncEvaluator, CachedEvaluator, PoolEvaluator
+from .islands import TOPOLOGIES, IslandModel
+from .optimizer import Optimizer, spawn_generators
+from .pso import ParticleSwarm, SteadyStateParticleSwarm, particle_swarm_optimization
+from .restarts import RestartController
+from .selection import rank_selection, roulette_selection, tournament_selection
+from .store import PersistentEvaluator
+from .tabu import TabuMemory, TabuSearch, tabu_search
+from .termination import Deadline, LowDiversity, MaxEvaluations, Stagnation, TargetScore, Termination
+from .trace import ConvergenceTrace, load_trace
@@ -0,0 +1,146 @@
+import numpy as np
+
+from .optimizer import Optimizer
+
+
+def generate_neighbors(solutions, bounds, step_size, rng=None):
+    rng = np.random.default_rng(rng)
+    neighbors = solutions + rng.uniform(-step_size, step_size, size=solutions.shape)
+    return np.clip(neighbors, bounds[0], bounds[1], out=neighbors)
+
+
+def acceptance_probability(current_scores, new_scores, temperature):
+    # Improvements give exp(0) = 1; the minimum also keeps exp from overflowing
+    return np.exp(np.minimum(current_scores - new_scores, 0) / temperature)
+
+
+def temperature_ladder(min_temperature, max_temperature, num_replicas):
+    return np.geomspace(min_temperature, max_temperature, num_replicas)
+
+
+def swap_replicas(solutions, scores, temperatures, offset, rng=None):
+    # Metropolis swap test between neighbours (i, i + 1) for every i with i % 2 == offset
+    rng = np.random.default_rng(rng)
+    lower = np.arange(offset, len(temperatures) - 1, 2)
+    upper = lower + 1
+    log_ratio = (1 / temperatures[lower] - 1 / temperatures[upper]) * (scores[lower] - scores[upper])
+    swapped = np.log(rng.random(lower.size)) < np.minimum(log_ratio, 0)
+    lower, upper = lower[swapped], upper[swapped]
+    solutions[[*lower, *upper]] = solutions[[*upper, *lower]]
+    scores[[*lower, *upper]] = scores[[*upper, *lower]]
+    return swapped
+
+
+class SimulatedAnnealing(Optimizer):
+    # num_chains independent chains advanced in lockstep, one batched evaluation per step
+    def __init__(self, objective_func, bounds, max_iterations, initial_temperature, final_temperature, step_size, num_chains=1, cooling_rate=0.9, rng=None, dimensions=None):
+        super().__init__(objective_func, bounds, rng, dimensions)
+        self.max_iterations = max_iterations
+        self.initial_temperature = initial_temperature
+        self.final_temperature = final_temperature
+        self.step_size = step_size
+        self.num_chains = num_chains
+        self.cooling_rate = cooling_rate
+        self.temperature = initial_temperature
+        self.current_solutions = None
+        self.current_scores = None
+        self.chain_best_solutions = None
+        self.chain_best_scores = None
+
+    def generate(self):
+        if self.current_solutions is None:
+            return self.initial_population(self.num_chains)
+        return generate_neighbors(self.current_solutions, self.bounds, self.step_size, self.rng)
+
+    def update(self, solutions, scores):
+        if self.current_solutions is None:
+            self.current_solutions = solutions.copy()
+            self.current_scores = scores.copy()
+            self.chain_best_solutions = solutions.copy()
+            self.chain_best_scores = scores.copy()
+            return
+
+        self.metropolis(solutions, scores, self.temperature)
+        self.temperature *= self.cooling_rate  # Cooling schedule
+        self.iteration += 1
+
+    def metropolis(self, solutions, scores, temperature):
+        ap = acceptance_probability(self.current_scores, scores, temperature)
+        accepted = ap > self.rng.random(len(scores))
+        self.current_solutions[accepted] = solutions[accepted]
+        self.current_scores[accepted] = scores[accepted]
+
+        improved = scores < self.chain_best_scores
+        self.chain_best_solutions[improved] = solutions[improved]
+        self.chain_best_scores[improved] = scores[improved]
+
+    def done(self):
+        if self.current_solutions is None:
+            return False
+        return not (self.temperature > self.final_temperature and self.iteration < self.max_iterations)
+
+    def population(self):
+        return self.current_solutions, self.current_scores
+
+    def replace(self, indices, solutions, scores):
+        self.current_solutions[indices] = solutions
+        self.current_scores[indices] = scores
+        improved = scores < self.chain_best_scores[indices]
+        self.chain_best_solutions[indices[improved]] = solutions[improved]
+        self.chain_best_scores[indices[improved]] = scores[improved]
+
+
+class ParallelTempering(SimulatedAnnealing):
+    # Replica exchange: one replica per temperature, all advanced in a single batch
+    def __init__(self, objective_func, bounds, num_replicas, max_iterations, min_temperature, max_temperature, step_size, swap_interval=10, rng=None, dimensions=None):
+        super().__init__(objective_func, bounds, max_iterations, max_temperature, min_temperature, step_size, num_chains=num_replicas, rng=rng,
+                         dimensions=dimensions)
+        self.temperatures = temperature_ladder(min_temperature, max_temperature, num_replicas)
+        self.swap_interval = swap_interval
+        self.swap_attempts = np.zeros(num_replicas - 1)
+        self.swap_accepts = np.zeros(num_replicas - 1)
+
+    def update(self, solutions, scores):
+        if self.current_solutions is None:
+            super().update(solutions, scores)
+            return
+
+        self.metropolis(solutions, scores, self.temperatures)
+        self.iteration += 1
+
+        if self.iteration % self.swap_interval == 0:
+            # Alternate between even and odd neighbour pairs
+            offset = (self.iteration // self.swap_interval) % 2
+            swapped = swap_replicas(self.current_solutions, self.current_scores, self.temperatures, offset, self.rng)
+            self.swap_attempts[offset::2] += 1
+            self.swap_accepts[offset::2] += swapped
+
+    def done(self):
+        return self.current_solutions is not None and self.iteration >= self.max_iterations
+
+    @property
+    def swap_rates(self):
+        return self.swap_accepts / np.maximum(self.swap_attempts, 1)
+
+
+def annealing_chains(objective_func, bounds, num_chains, max_iterations, initial_temperature, final_temperature, step_size, cooling_rate=0.9, rng=None,
+                     dimensions=None):
+    annealer = SimulatedAnnealing(objective_func, bounds, max_iterations, initial_temperature, final_temperature, step_size, num_chains, cooling_rate, rng,
+                                  dimensions)
+    best_solution = annealer.optimize()
+    return best_solution, annealer.best_score, annealer.chain_best_solutions, annealer.chain_best_scores
+
+
+def parallel_tempering(objective_func, bounds, num_replicas, max_iterations, min_temperature, max_temperature, step_size, swap_interval=10, rng=None,
+                       dimensions=None):
+    tempering = ParallelTempering(objective_func, bounds, num_replicas, max_iterations, min_temperature, max_temperature, step_size, swap_interval, rng,
+                                  dimensions)
+    best_solution = tempering.optimize()
+    return best_solution, tempering.best_score, tempering.swap_rates
+
+
+def simulated_annealing(objective_func, bounds, max_iterations, initial_temperature, final_temperature, step_size, cooling_rate=0.9, rng=None,
+                        dimensions=None):
+    annealer = SimulatedAnnealing(objective_func, bounds, max_iterations, initial_temperature, final_temperature, step_size, cooling_rate=cooling_rate, rng=rng,
+                                  dimensions=dimensions)
+    return annealer.optimize()
@@ -0,0 +1,73 @@
+import numpy as np
+
+from .optimizer import Optimizer
+
+
+def mean_absolute_distances(archive):
+    # For every archive row and dimension, the mean |s_e - s_l| over the other rows,
+    # computed per column from sorted values in O(k log k) instead of O(k^2)
+    k = archive.shape[0]
+    order = np.argsort(archive, axis=0)
+    values = np.take_along_axis(archive, order, axis=0)
+    below = np.cumsum(values, axis=0) - values
+    above = values.sum(axis=0) - below - values
+    rank = np.arange(k)[:, np.newaxis]
+    totals = rank * values - below + above - (k - 1 - rank) * values
+    distances = np.empty_like(archive)
+    np.put_along_axis(distances, order, totals / max(k - 1, 1), axis=0)
+    return distances
+
+
+class AntColonySystem(Optimizer):
+    # Continuous ant colony optimization (ACO_R): the pheromone model is a sorted
+    # archive of solutions, each acting as a Gaussian kernel ants sample from
+    def __init__(self, objective_func, bounds, num_ants, num_iterations, archive_size=50, q=0.1, xi=0.85, rng=None, dimensions=None):
+        super().__init__(objective_func, bounds, rng, dimensions)
+        self.num_ants = num_ants
+        self.num_iterations = num_iterations
+        self.archive_size = archive_size
+        self.q = q  # Locality: small values favour the best archive solutions
+        self.xi = xi  # Pheromone evaporation analogue: width of the sampling kernels
+        self.archive = None
+        self.archive_scores = None
+        self.probabilities = self.kernel_probabilities()
+
+    def generate(self):
+        if self.archive is None:
+            return self.initial_population(self.archive_size)
+        return self.construct_solutions()
+
+    def update(self, solutions, scores):
+        if self.archive is None:
+            self.archive, self.archive_scores = self.sort_archive(solutions, scores)
+            return
+
+        self.archive, self.archive_scores = self.sort_archive(np.concatenate((self.archive, solutions)), np.concatenate((self.archive_scores, scores)))
+        self.iteration += 1
+
+    def done(self):
+        return self.iteration >= self.num_iterations
+
+    def population(self):
+        return self.archive, self.archive_scores
+
+    def replace(self, indices, solutions, scores):
+        self.archive[indices] = solutions
+        self.archive_scores[indices] = scores
+        self.archive, self.archive_scores = self.sort_archive(self.archive, self.archive_scores)
+
+    def sort_archive(self, archive, scores):
+        order = np.argsort(scores, kind='stable')[:self.archive_size]
+        return archive[order], scores[order]
+
+    def kernel_probabilities(self):
+        k = self.archive_size
+        rank = np.arange(k)
+        weights = np.exp(-rank**2 / (2 * (self.q * k)**2)) / (self.q * k * np.sqrt(2 * np.pi))
+        return weights / np.sum(weights)
+
+    def construct_solutions(self):
+        kernels = self.rng.choice(self.archive_size, size=self.num_ants, p=self.probabilities)
+        sigma = self.xi * mean_absolute_distances(self.archive)
+        ants = self.archive[kernels] + sigma[kernels] * self.rng.normal(size=(self.num_ants, self.archive.shape[1]))
+        return np.clip(ants, self.lower, self.upper, out=ants)
@@ -0,0 +1,119 @@
+import numpy as np
+
+from .optimizer import Optimizer
+from .selection import SELECTIONS
+
+
+def recruit_counts(weights, num_recruits):
+    # Split num_recruits proportionally to weights; leftovers go to the best sites
+    counts = np.floor(num_recruits * weights / np.sum(weights)).astype(int)
+    leftover = num_recruits - np.sum(counts)
+    counts[np.flatnonzero(weights)[:leftover]] += 1
+    return counts
+
+
+def best_per_site(site_ids, scores):
+    # Index of the best neighbour of every site that had recruits
+    order = np.lexsort((scores, site_ids))
+    groups = site_ids[order]
+    first = np.concatenate(([True], groups[1:] != groups[:-1]))
+    return groups[first], order[first]
+
+
+class BeesAlgorithm(Optimizer):
+    def __init__(self, objective_func, bounds, num_employed_bees, num_onlooker_bees, max_iterations,
+                 num_selected_sites=None, num_elite_sites=None, patch_size=1.0, shrink_factor=0.8, stagnation_limit=10, selection=None, rng=None, dimensions=None):
+        super().__init__(objective_func, bounds, rng, dimensions)
+        self.num_employed_bees = num_employed_bees  # Number of sites
+        self.num_onlooker_bees = num_onlooker_bees  # Recruits shared by the selected sites
+        self.max_iterations = max_iterations
+        self.num_selected_sites = min(num_selected_sites or max(1, num_employed_bees // 2), num_employed_bees)
+        self.num_elite_sites = num_elite_sites or max(1, self.num_selected_sites // 5)
+        self.patch_size = patch_size  # Initial half-width of a site's neighbourhood
+        self.shrink_factor = shrink_factor  # Patch shrinking when a site does not improve
+        self.stagnation_limit = stagnation_limit  # Iterations without improvement before a site is abandoned
+        self.selection = SELECTIONS.get(selection, selection)  # None recruits deterministically by site rank
+        self.sites = None
+        self.scores = None
+        self.patches = np.full(num_employed_bees, float(patch_size))
+        self.stagnation = np.zeros(num_employed_bees, dtype=int)
+        self.site_ids = None
+        self.scout_ids = None
+
+    def generate(self):
+        if self.sites is None:
+            return self.initial_population(self.num_employed_bees)
+
+        num_selected = self.num_selected_sites
+        order = np.argsort(self.scores)
+        self.sites, self.scores = self.sites[order], self.scores[order]
+        self.patches, self.stagnation = self.patches[order], self.stagnation[order]
+
+        # Unselected and abandoned sites are replaced by scouts
+        scouting = np.arange(self.num_employed_bees) >= num_selected
+        scouting[:num_selected] |= self.stagnation[:num_selected] > self.stagnation_limit
+
+        # Onlooker recruitment: elite sites get twice the share of other selected sites
+        weights = np.where(np.arange(num_selected) < self.num_elite_sites, 2.0, 1.0)
+        weights[scouting[:num_selected]] = 0
+        self.site_ids = self.select_onlooker_bees(self.scores[:num_selected], weights)
+        self.scout_ids = np.flatnonzero(scouting)
+
+        # Neighbours of every site and all scouts are scored in one batch
+        neighbors = self.explore_neighborhood(self.sites[self.site_ids], self.patches[self.site_ids])
+        return np.concatenate((neighbors, self.scout(self.scout_ids.size)))
+
+    def update(self, solutions, scores):
+        if self.sites is None:
+            self.sites = solutions.copy()
+            self.scores = scores.copy()
+            return
+
+        num_neighbors = self.site_ids.size
+        neighbors, neighbor_scores = solutions[:num_neighbors], scores[:num_neighbors]
+        if num_neighbors:
+            groups, best = best_per_site(self.site_ids, neighbor_scores)
+            improved = neighbor_scores[best] < self.scores[groups]
+            moved, stalled = groups[improved], groups[~improved]
+            self.sites[moved] = neighbors[best[improved]]
+            self.scores[moved] = neighbor_scores[best[improved]]
+            self.stagnation[moved] = 0
+            # Sites that did not improve shrink their patch
+            self.patches[stalled] *= self.shrink_factor
+            self.stagnation[stalled] += 1
+
+        self.sites[self.scout_ids] = solutions[num_neighbors:]
+        self.scores[self.scout_ids] = scores[num_neighbors:]
+        self.patches[self.scout_ids] = self.patch_size
+        self.stagnation[self.scout_ids] = 0
+        self.iteration += 1
+
+    def done(self):
+        return self.iteration >= self.max_iterations
+
+    def population(self):
+        return self.sites, self.scores
+
+    def replace(self, indices, solutions, scores):
+        self.sites[indices] = solutions
+        self.scores[indices] = scores
+        self.patches[indices] = self.patch_size
+        self.stagnation[indices] = 0
+
+    def scout(self, num_bees):
+        return self.rng.uniform(self.lower, self.upper, size=(num_bees, self.dimensions))
+
+    def select_onlooker_bees(self, scores, weights):
+        candidates = np.flatnonzero(weights)
+        if candidates.size == 0:
+            return np.empty(0, dtype=int)
+        if self.selection is None:
+            return np.repeat(np.arange(len(weights)), recruit_counts(weights, self.num_onlooker_bees))
+        # A site enters the strategy's pool once per unit of weight, so elite sites
+        # are twice as likely to be picked whatever the strategy
+        pool = np.repeat(candidates, weights[candidates].astype(int))
+        return np.sort(pool[self.selection(scores[pool], self.num_onlooker_bees, rng=self.rng)])
+
+    def explore_neighborhood(self, positions, patches):
+        neighbors = positions + patches[:, np.newaxis] * self.rng.uniform(-1, 1, size=positions.shape)
+        return np.clip(neighbors, self.lower, self.upper, out=neighbors)
@@ -0,0 +1,147 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from .benchmarks import ALL_FUNCTIONS, FIXED_DIMENSIONS, FUNCTIONS, as_batch, optimum
+from .evaluation import Evaluator
+from .experiments import ALGORITHMS, make_optimizer, population_params
+
+
+class TargetTracker(Evaluator):
+    # Counts evaluations and records when a score first reaches the target
+    def __init__(self, evaluator, target=None):
+        self.evaluator = evaluator
+        self.target = target
+        self.evaluations = 0
+        self.start = time.perf_counter()
+        self.time_to_target = None
+        self.evaluations_to_target = None
+
+    def __call__(self, solutions):
+        scores = self.evaluator(solutions)
+        if self.target is not None and self.time_to_target is None:
+            reached = np.flatnonzero(scores <= self.target)
+            if reached.size:
+                self.time_to_target = time.perf_counter() - self.start
+                self.evaluations_to_target = self.evaluations + int(reached[0]) + 1
+        self.evaluations += len(scores)
+        return scores
+
+
+def benchmark_case(algorithm, function, dimensions, population, seed=0, repeats=3, measure_memory=True, target_tolerance=1e-3):
+    params = population_params(algorithm, population)
+    target = optimum(function, dimensions)
+    if target is not None:
+        target += target_tolerance
+
+    runs = []
+    for repeat in range(repeats):
+        optimizer = make_optimizer(algorithm, function, dimensions, params, seed + repeat)
+        tracker = TargetTracker(as_batch(ALL_FUNCTIONS[function]), target)
+        start = time.perf_counter()
+        optimizer.optimize(tracker)
+        elapsed = time.perf_counter() - start
+        runs.append((elapsed, tracker, optimizer.best_score))
+
+    # The median run by wall time is reported
+    elapsed, tracker, best_score = sorted(runs, key=lambda run: run[0])[len(runs) // 2]
+    peak_memory = None
+    if measure_memory:
+        # Separate run: tracing allocations would distort the timings above
+        optimizer = make_optimizer(algorithm, function, dimensions, params, seed)
+        tracemalloc.start()
+        optimizer.optimize()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        'algorithm': algorithm,
+        'function': function,
+        'dimensions': dimensions,
+        'population': population,
+        'time': elapsed,
+        'evaluations': tracker.evaluations,
+        'evaluations_per_second': tracker.evaluations / elapsed if elapsed > 0 else None,
+        'peak_memory': peak_memory,
+        'best_score': float(best_score),
+        'time_to_target': tracker.time_to_target,
+        'evaluations_to_target': tracker.evaluations_to_target,
+    }
+
+
+def case_key(result):
+    return '%(algorithm)s/%(function)s/D%(dimensions)d/N%(population)d' % result
+
+
+def benchmark_suite(algorithms, functions, dimensions, populations, **options):
+    results = []
+    for algorithm in algorithms:
+        for function in functions:
+            for num_dimensions in dimensions:
+                if FIXED_DIMENSIONS.get(function, num_dimensions) != num_dimensions:
+                    continue
+                for population in populations:
+                    result = benchmark_case(algorithm, function, num_dimensions, population, **options)
+                    print('%-40s %8.3fs %10d evals %12.0f evals/s' % (
+                        case_key(result), result['time'], result['evaluations'], result['evaluations_per_second'] or 0),
+                        file=sys.stderr)
+                    results.append(result)
+    return results
+
+
+def compare(results, baseline, threshold=1.2):
+    # Cases whose wall time grew or whose peak memory grew by more than threshold
+    previous = {case_key(result): result for result in baseline['results']}
+    regressions = []
+    for result in results:
+        old = previous.get(case_key(result))
+        if old is None:
+            continue
+        for metric in ('time', 'peak_memory'):
+            if result[metric] and old[metric] and result[metric] > threshold * old[metric]:
+                regressions.append((case_key(result), metric, old[metric], result[metric]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m metody_si.bench',
+                                     description='Measure throughput and scaling of every engine.')
+    parser.add_argument('--algorithms', nargs='+', default=list(ALGORITHMS), choices=list(ALGORITHMS))
+    parser.add_argument('--functions', nargs='+', default=list(FUNCTIONS), choices=list(ALL_FUNCTIONS))
+    parser.add_argument('--dimensions', nargs='+', type=int, default=[2, 10])
+    parser.add_argument('--populations', nargs='+', type=int, default=[20, 200])
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--no-memory', action='store_true', help='skip the peak memory run')
+    parser.add_argument('--output', default='bench.json')
+    parser.add_argument('--compare', metavar='BASELINE', help='earlier output to check for regressions')
+    parser.add_argument('--threshold', type=float, default=1.2, help='allowed slowdown ratio before flagging')
+    args = parser.parse_args(argv)
+
+    results = benchmark_suite(args.algorithms, args.functions, args.dimensions, args.populations,
+                              repeats=args.repeats, measure_memory=not args.no_memory)
+    report = {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': results,
+    }
+    with open(args.output, 'w') as file:
+        json.dump(report, file, indent=1)
+
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(results, json.load(file), args.threshold)
+        for key, metric, old, new in regressions:
+            print('REGRESSION %s %s: %.4g -> %.4g' % (key, metric, old, new))
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,249 @@
+import numpy as np
+
+# Every *_batch function takes an (N, D) array of points and returns an (N,) score vector.
+# The plain-named wrappers score a single point and accept both calling conventions used
+# in the lab scripts: f(x, y, ...) and f(np.array([x, y, ...])).
+#
+# FUNCTIONS follows the standard textbook definitions, so results compare with the
+# literature. Some lab scripts used other formulas under the same names: the Tabu
+# griewank sums the cosines instead of multiplying them, the BFOA schwefel has no
+# 418.9829 * D offset, the BFOA levy is Levy N.13, the BFOA holder_table has a
+# second term and the SA langermann is sum(c * cos(pi * t1 + t2)) without exp.
+# Those variants are kept in LAB_VARIANTS under their own names; use them to
+# reproduce the tables in 'wyniki tabele eksperymentu.docx'.
+
+LANGERMANN_A = np.array([[3, 5], [5, 2], [2, 1], [1, 4]], dtype=float)
+LANGERMANN_C = np.array([1, 2, 5, 2], dtype=float)
+
+
+def _as_population(X):
+    X = np.asarray(X, dtype=float)
+    if X.ndim == 1:
+        X = X[np.newaxis, :]
+    return X
+
+
+def _as_point(args):
+    if len(args) == 1 and np.ndim(args[0]) > 0:
+        return np.asarray(args[0], dtype=float)
+    return np.array(args, dtype=float)
+
+
+def holder_table_batch(X):
+    X = _as_population(X)
+    x, y = X[:, 0], X[:, 1]
+    part1 = np.sin(x) * np.cos(y)
+    part2 = np.exp(np.abs(1 - np.sqrt(x**2 + y**2) / np.pi))
+    return -np.abs(part1 * part2)
+
+
+def griewank_batch(X):
+    X = _as_population(X)
+    i = np.arange(1, X.shape[1] + 1)
+    part1 = np.sum(X**2, axis=1) / 4000
+    part2 = np.prod(np.cos(X / np.sqrt(i)), axis=1)
+    return 1 + part1 - part2
+
+
+def ackley_batch(X, a=20, b=0.2, c=2 * np.pi):
+    X = _as_population(X)
+    n = X.shape[1]
+    sum1 = np.sum(X**2, axis=1)
+    sum2 = np.sum(np.cos(c * X), axis=1)
+    return -a * np.exp(-b * np.sqrt(sum1 / n)) - np.exp(sum2 / n) + a + np.exp(1)
+
+
+def levy_batch(X):
+    X = _as_population(X)
+    w = 1 + (X - 1) / 4
+    term1 = np.sin(np.pi * w[:, 0])**2
+    term2 = np.sum((w[:, :-1] - 1)**2 * (1 + 10 * np.sin(np.pi * w[:, :-1] + 1)**2), axis=1)
+    term3 = (w[:, -1] - 1)**2 * (1 + np.sin(2 * np.pi * w[:, -1])**2)
+    return term1 + term2 + term3
+
+
+def langermann_batch(X, A=LANGERMANN_A, c=LANGERMANN_C):
+    X = _as_population(X)
+    # (N, M) squared distances to every centre in A
+    distance = np.sum((X[:, np.newaxis, :] - A[np.newaxis, :, :X.shape[1]])**2, axis=2)
+    return -np.sum(c * np.exp(-distance / np.pi) * np.cos(np.pi * distance), axis=1)
+
+
+def michalewicz_batch(X, m=10):
+    X = _as_population(X)
+    i = np.arange(1, X.shape[1] + 1)
+    return -np.sum(np.sin(X) * np.sin(i * X**2 / np.pi)**(2 * m), axis=1)
+
+
+def schwefel_batch(X):
+    X = _as_population(X)
+    return 418.9829 * X.shape[1] - np.sum(X * np.sin(np.sqrt(np.abs(X))), axis=1)
+
+
+def zakharov_batch(X):
+    X = _as_population(X)
+    i = np.arange(1, X.shape[1] + 1)
+    term1 = np.sum(X**2, axis=1)
+    term2 = np.sum(0.5 * i * X, axis=1)
+    return term1 + term2**2 + term2**4
+
+
+def drop_wave_batch(X):
+    X = _as_population(X)
+    r2 = np.sum(X**2, axis=1)
+    numerator = 1 + np.cos(12 * np.sqrt(r2))
+    denominator = 0.5 * r2 + 2
+    return -numerator / denominator
+
+
+def griewank_tabu_batch(X):
+    X = _as_population(X)
+    i = np.arange(1, X.shape[1] + 1)
+    return 1 + np.sum(X**2, axis=1) / 4000 - np.sum(np.cos(X / np.sqrt(i)), axis=1)
+
+
+def schwefel_bfoa_batch(X):
+    X = _as_population(X)
+    return -np.sum(X * np.sin(np.sqrt(np.abs(X))), axis=1)
+
+
+def levy_bfoa_batch(X):
+    # Levy N.13, 2-D only
+    X = _as_population(X)
+    x, y = X[:, 0], X[:, 1]
+    term1 = np.sin(3 * np.pi * x)**2
+    term2 = (x - 1)**2 * (1 + np.sin(3 * np.pi * y)**2)
+    term3 = (y - 1)**2 * (1 + np.sin(2 * np.pi * y)**2)
+    return term1 + term2 + term3
+
+
+def holder_table_bfoa_batch(X):
+    X = _as_population(X)
+    x, y = X[:, 0], X[:, 1]
+    part2 = np.exp(np.abs(1 - np.sqrt(x**2 + y**2) / np.pi))
+    return -np.abs(np.sin(x) * np.cos(y) * part2) - np.abs(part2 * np.abs(np.sin(y) * np.cos(x)))
+
+
+def langermann_sa_batch(X, A=LANGERMANN_A, c=LANGERMANN_C):
+    X = _as_population(X)
+    x, y = X[:, 0, np.newaxis], X[:, 1, np.newaxis]
+    return -np.sum(c * np.cos(np.pi * (x - A[:, 0])**2 + (y - A[:, 1])**2), axis=1)
+
+
+class ScalarFunction:
+    # Single-point wrapper around a batch function; unlike a closure it can be
+    # pickled, so benchmark functions can be shipped to worker processes
+    def __init__(self, batch_func, name=None):
+        self.batch = batch_func
+        self.__name__ = name or batch_func.__name__.replace('_batch', '')
+
+    def __call__(self, *args):
+        return float(self.batch(_as_point(args)[np.newaxis, :])[0])
+
+    def __repr__(self):
+        return '<benchmark function %s>' % self.__name__
+
+
+def as_batch(objective_func):
+    # Functions from this module carry their vectorized version; anything else is
+    # a user-supplied scalar function taking a 1-D point and is looped over.
+    batch_func = getattr(objective_func, 'batch', None)
+    if batch_func is not None:
+        return batch_func
+
+    def looped(X):
+        return np.array([objective_func(x) for x in _as_population(X)], dtype=float)
+
+    looped.__name__ = getattr(objective_func, '__name__', 'objective')
+    looped.objective_func = objective_func
+    return looped
+
+
+holder_table = ScalarFunction(holder_table_batch)
+griewank = ScalarFunction(griewank_batch)
+ackley = ScalarFunction(ackley_batch)
+levy = ScalarFunction(levy_batch)
+langermann = ScalarFunction(langermann_batch)
+michalewicz = ScalarFunction(michalewicz_batch)
+schwefel = ScalarFunction(schwefel_batch)
+zakharov = ScalarFunction(zakharov_batch)
+drop_wave = ScalarFunction(drop_wave_batch)
+
+griewank_tabu = ScalarFunction(griewank_tabu_batch)
+schwefel_bfoa = ScalarFunction(schwefel_bfoa_batch)
+levy_bfoa = ScalarFunction(levy_bfoa_batch)
+holder_table_bfoa = ScalarFunction(holder_table_bfoa_batch)
+langermann_sa = ScalarFunction(langermann_sa_batch)
+
+FUNCTIONS = {
+    'holder_table': holder_table,
+    'griewank': griewank,
+    'ackley': ackley,
+    'levy': levy,
+    'langermann': langermann,
+    'michalewicz': michalewicz,
+    'schwefel': schwefel,
+    'zakharov': zakharov,
+    'drop_wave': drop_wave,
+}
+
+LAB_VARIANTS = {
+    'griewank_tabu': griewank_tabu,
+    'schwefel_bfoa': schwefel_bfoa,
+    'levy_bfoa': levy_bfoa,
+    'holder_table_bfoa': holder_table_bfoa,
+    'langermann_sa': langermann_sa,
+}
+
+ALL_FUNCTIONS = {**FUNCTIONS, **LAB_VARIANTS}
+
+# Search domains used in the lab experiments
+BOUNDS = {
+    'holder_table': (-10, 10),
+    'griewank': (-600, 600),
+    'ackley': (-5, 5),
+    'levy': (-10, 10),
+    'langermann': (0, 10),
+    'michalewicz': (0, np.pi),
+    'schwefel': (-500, 500),
+    'zakharov': (-5, 5),
+    'drop_wave': (-5.12, 5.12),
+    'griewank_tabu': (-600, 600),
+    'schwefel_bfoa': (-500, 500),
+    'levy_bfoa': (-10, 10),
+    'holder_table_bfoa': (-10, 10),
+    'langermann_sa': (0, 10),
+}
+
+# Functions only defined for a fixed number of dimensions
+FIXED_DIMENSIONS = {
+    'holder_table': 2,
+    'langermann': 2,
+    'levy_bfoa': 2,
+    'holder_table_bfoa': 2,
+    'langermann_sa': 2,
+}
+
+# Known global minima of the functions as defined here, per number of dimensions
+# where it matters (None: any dimension)
+OPTIMA = {
+    'holder_table': {None: -19.2085},
+    'griewank': {None: 0.0},
+    'ackley': {None: 0.0},
+    'levy': {None: 0.0},
+    'langermann': {None: -5.1621},
+    'michalewicz': {2: -1.8013, 5: -4.687658, 10: -9.66015},
+    'schwefel': {None: 0.0},
+    'zakharov': {None: 0.0},
+    'drop_wave': {None: -1.0},
+    'levy_bfoa': {None: 0.0},
+}
+
+
+def optimum(name, dimensions):
+    known = OPTIMA.get(name, {})
+    if name == 'griewank_tabu':
+        return 1.0 - dimensions
+    if name == 'schwefel_bfoa':
+        return -418.9829 * dimensions
+    return known.get(dimensions, known.get(None))
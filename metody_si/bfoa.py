@@ -0,0 +1,144 @@
+import numpy as np
+
+from .optimizer import Optimizer
+from .selection import SELECTIONS
+
+
+class BacterialForagingOptimization(Optimizer):
+    # Elimination-dispersal events wrap reproduction cycles, which wrap chemotactic
+    # steps (a tumble followed by up to max_swim_steps swims). self.phase records
+    # which batch the colony is waiting on: 'init', 'tumble', 'swim' or 'disperse'.
+    # num_iterations keeps its lab-script meaning, the total number of chemotactic
+    # steps; every reproduction cycle gets an equal share of it (at least one).
+    def __init__(self, objective_func, bounds, num_bacteria, num_iterations, chemotactic_step_size, swim_length, tumble_rate,
+                 max_swim_steps=4, num_reproductions=4, num_eliminations=2, selection=None, rng=None, dimensions=None):
+        super().__init__(objective_func, bounds, rng, dimensions)
+        self.num_bacteria = num_bacteria
+        self.num_iterations = num_iterations  # Chemotactic steps in the whole run
+        self.num_chemotactic_steps = max(1, num_iterations // max(1, num_reproductions * num_eliminations))
+        self.chemotactic_step_size = chemotactic_step_size  # Length of a tumble move
+        self.swim_length = swim_length  # Length of a single swim step
+        self.tumble_rate = tumble_rate  # Elimination-dispersal probability
+        self.max_swim_steps = max_swim_steps
+        self.num_reproductions = num_reproductions
+        self.num_eliminations = num_eliminations
+        self.selection = SELECTIONS.get(selection, selection)  # None splits the healthier half
+        self.phase = 'init'
+        self.chemotactic_step = 0
+        self.reproduction = 0
+        self.elimination = 0
+        self.swim_step = 0
+        self.positions = None
+        self.scores = None
+        self.previous_scores = None
+        self.directions = None
+        self.health = np.zeros(num_bacteria)
+        self.swimming = None
+        self.dispersed = None
+
+    def generate(self):
+        if self.phase == 'init':
+            self.positions = self.initial_population(self.num_bacteria)
+            return self.positions
+        if self.phase == 'tumble':
+            return self.tumble()
+        if self.phase == 'swim':
+            return self.swim()
+        return self.disperse()
+
+    def update(self, solutions, scores):
+        if self.phase == 'init':
+            self.scores = scores.copy()
+            self.phase = 'tumble' if self.num_eliminations else 'done'
+        elif self.phase == 'tumble':
+            self.scores = scores.copy()
+            self.swim_step = 0
+            self.swimming = np.arange(self.num_bacteria)
+            self.continue_swim()
+        elif self.phase == 'swim':
+            self.positions[self.swimming] = solutions
+            self.scores[self.swimming] = scores
+            self.swim_step += 1
+            self.continue_swim()
+        else:
+            self.scores[self.dispersed] = scores
+            self.end_elimination()
+
+    def done(self):
+        return self.phase == 'done'
+
+    def population(self):
+        return self.positions, self.scores
+
+    def replace(self, indices, solutions, scores):
+        self.positions[indices] = solutions
+        self.scores[indices] = scores
+
+    def initialize_bacteria(self, num_bacteria):
+        return self.rng.uniform(self.lower, self.upper, size=(num_bacteria, self.dimensions))
+
+    def tumble(self):
+        # Every bacterium moves one step in a fresh random direction
+        self.directions = self.rng.normal(size=(self.num_bacteria, self.dimensions))
+        self.directions /= np.linalg.norm(self.directions, axis=1, keepdims=True) + 1e-12
+        self.previous_scores = self.scores.copy()
+        self.positions += self.chemotactic_step_size * self.directions
+        np.clip(self.positions, self.lower, self.upper, out=self.positions)
+        return self.positions
+
+    def swim(self):
+        moved = self.positions[self.swimming] + self.swim_length * self.directions[self.swimming]
+        return np.clip(moved, self.lower, self.upper, out=moved)
+
+    def continue_swim(self):
+        # Keep moving along the same direction while the score improves
+        if self.swim_step < self.max_swim_steps:
+            self.swimming = self.swimming[self.scores[self.swimming] < self.previous_scores[self.swimming]]
+            if self.swimming.size:
+                self.previous_scores = self.scores.copy()
+                self.phase = 'swim'
+                return
+        self.end_chemotactic_step()
+
+    def end_chemotactic_step(self):
+        self.health += self.scores
+        self.chemotactic_step += 1
+        self.iteration += 1
+        self.phase = 'tumble'
+        if self.chemotactic_step < self.num_chemotactic_steps:
+            return
+
+        self.chemotactic_step = 0
+        self.reproduce()
+        self.health = np.zeros(self.num_bacteria)
+        self.reproduction += 1
+        if self.reproduction < self.num_reproductions:
+            return
+
+        self.reproduction = 0
+        self.dispersed = np.flatnonzero(self.rng.random(self.num_bacteria) < self.tumble_rate)
+        if self.dispersed.size:
+            self.phase = 'disperse'
+        else:
+            self.end_elimination()
+
+    def reproduce(self):
+        # The healthier half (lowest accumulated cost) survives; the other half is
+        # replaced by copies of the survivors or of bacteria chosen by self.selection
+        order = np.argsort(self.health)
+        half = self.num_bacteria // 2
+        survivors = order[:self.num_bacteria - half]
+        if self.selection is None:
+            offspring = survivors[:half]
+        else:
+            offspring = self.selection(self.health, half, rng=self.rng)
+        kept = np.concatenate((survivors, offspring))
+        self.positions, self.scores = self.positions[kept], self.scores[kept]
+
+    def disperse(self):
+        self.positions[self.dispersed] = self.initialize_bacteria(self.dispersed.size)
+        return self.positions[self.dispersed]
+
+    def end_elimination(self):
+        self.elimination += 1
+        self.phase = 'tumble' if self.elimination < self.num_eliminations else 'done'
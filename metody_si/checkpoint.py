@@ -0,0 +1,39 @@
+import os
+import pickle
+import tempfile
+
+# Every engine keeps its whole state (populations, archives, temperatures,
+# counters, its numpy Generator) in instance attributes, so a checkpoint is the
+# pickled optimizer. Arrays pickle as raw buffers, which keeps files compact.
+# The objective function is pickled by reference, so it must be importable
+# (module-level functions and the benchmark functions are; lambdas are not).
+
+
+def save_checkpoint(optimizer, path):
+    # Written to a temporary file in the same directory and renamed over path, so a
+    # crash mid-write leaves the previous checkpoint intact
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temporary = tempfile.mkstemp(prefix='.checkpoint-', dir=directory)
+    try:
+        with os.fdopen(descriptor, 'wb') as file:
+            pickle.dump(optimizer, file, protocol=pickle.HIGHEST_PROTOCOL)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def load_checkpoint(path):
+    with open(path, 'rb') as file:
+        return pickle.load(file)
+
+
+def resume(path, evaluator=None, checkpoint_interval=60.0):
+    # Continues a run from its last checkpoint, checkpointing to the same file.
+    # Given the same evaluator results, the resumed run matches an uninterrupted one exactly.
+    optimizer = load_checkpoint(path)
+    optimizer.optimize(evaluator, checkpoint=path, checkpoint_interval=checkpoint_interval)
+    return optimizer
+
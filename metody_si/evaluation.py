@@ -0,0 +1,220 @@
+import asyncio
+import inspect
+import math
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from .benchmarks import as_batch
+
+# Evaluators are callables mapping an (N, D) array of solutions to (N,) scores and
+# can be passed to Optimizer.optimize(evaluator=...) for any engine.
+
+_worker_evaluate = None
+_worker_buffer = None
+
+# Bugs in the objective rather than transient failures: never retried or masked
+PROGRAMMING_ERRORS = (TypeError, AttributeError, NameError, ImportError, AssertionError)
+
+
+def _init_worker(objective_func):
+    global _worker_evaluate
+    _worker_evaluate = as_batch(objective_func)
+
+
+def _attach(name):
+    # Workers only read the block; the parent owns it and unlinks it
+    global _worker_buffer
+    if _worker_buffer is None or _worker_buffer.name != name:
+        if _worker_buffer is not None:
+            _worker_buffer.close()
+        _worker_buffer = shared_memory.SharedMemory(name=name)
+    return _worker_buffer
+
+
+def _evaluate_shared(name, shape, start, stop):
+    buffer = _attach(name)
+    solutions = np.ndarray(shape, dtype=float, buffer=buffer.buf)[start:stop]
+    return _worker_evaluate(solutions)
+
+
+def _evaluate_chunk(solutions):
+    return _worker_evaluate(solutions)
+
+
+def solution_keys(solutions, tolerance=None):
+    # Hashable per-row keys: grid cells of width tolerance, or the exact coordinates
+    if tolerance:
+        cells = np.floor(solutions / tolerance).astype(np.int64)
+    else:
+        cells = solutions + 0.0
+    return [row.tobytes() for row in cells]
+
+
+class Evaluator:
+    # Base for batch evaluators; the batch attribute lets as_batch() pass them through
+    # unchanged, so evaluators can wrap each other
+    def batch(self, solutions):
+        return self(solutions)
+
+
+class PoolEvaluator(Evaluator):
+    # Splits a population into chunks scored in parallel by a process pool. With
+    # shared_memory=True the population is written once to a shared block that the
+    # workers slice, instead of pickling every chunk. Results come back in order.
+    def __init__(self, objective_func, num_workers=None, chunk_size=None, shared_memory=True):
+        self.objective_func = objective_func
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.shared_memory = shared_memory
+        if shared_memory and os.name == 'posix':
+            # Workers must share the parent's tracker, or their own trackers would
+            # unlink the block when they exit
+            resource_tracker.ensure_running()
+        self.executor = ProcessPoolExecutor(self.num_workers, initializer=_init_worker, initargs=(objective_func,))
+        self.buffer = None
+
+    def __call__(self, solutions):
+        solutions = np.asarray(solutions, dtype=float)
+        if solutions.ndim == 1:
+            solutions = solutions[np.newaxis, :]
+        num_solutions = len(solutions)
+        if num_solutions == 0:
+            return np.empty(0)
+
+        chunk_size = self.chunk_size or math.ceil(num_solutions / (4 * self.num_workers))
+        starts = range(0, num_solutions, chunk_size)
+        if self.shared_memory:
+            self.ensure_buffer(solutions.nbytes)
+            np.ndarray(solutions.shape, dtype=float, buffer=self.buffer.buf)[:] = solutions
+            futures = [self.executor.submit(_evaluate_shared, self.buffer.name, solutions.shape, start, start + chunk_size)
+                       for start in starts]
+        else:
+            futures = [self.executor.submit(_evaluate_chunk, solutions[start:start + chunk_size]) for start in starts]
+        return np.concatenate([future.result() for future in futures]).astype(float, copy=False)
+
+    def submit(self, solutions):
+        # Single asynchronous request, used by steady-state engines
+        return self.executor.submit(_evaluate_chunk, np.atleast_2d(solutions))
+
+    def ensure_buffer(self, nbytes):
+        if self.buffer is not None and self.buffer.size >= nbytes:
+            return
+        self.release_buffer()
+        self.buffer = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+
+    def release_buffer(self):
+        if self.buffer is not None:
+            self.buffer.close()
+            self.buffer.unlink()
+            self.buffer = None
+
+    def close(self):
+        self.executor.shutdown()
+        self.release_buffer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class AsyncEvaluator(Evaluator):
+    # Issues all evaluations of a population concurrently, at most max_concurrency
+    # at a time. objective_func scores one 1-D point: a coroutine function or an
+    # object with an async __call__ is awaited, plain functions are run in threads
+    # (an awaitable they return is awaited too). A call that fails or exceeds
+    # timeout is retried up to retries times with exponential backoff; after that
+    # the error is raised, or failure_score is used when given. PROGRAMMING_ERRORS
+    # are always raised at once.
+    def __init__(self, objective_func, max_concurrency=16, timeout=None, retries=0, retry_delay=0.1, failure_score=None):
+        self.objective_func = objective_func
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.failure_score = failure_score
+
+    async def call(self, solution):
+        objective_func = self.objective_func
+        if inspect.iscoroutinefunction(objective_func) or inspect.iscoroutinefunction(getattr(objective_func, '__call__', None)):
+            result = objective_func(solution)
+        else:
+            result = await asyncio.to_thread(objective_func, solution)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def evaluate_one(self, solution, semaphore):
+        async with semaphore:
+            for attempt in range(self.retries + 1):
+                try:
+                    return float(await asyncio.wait_for(self.call(solution), self.timeout))
+                except PROGRAMMING_ERRORS:
+                    raise
+                except Exception:
+                    if attempt < self.retries:
+                        await asyncio.sleep(self.retry_delay * 2**attempt)
+                    elif self.failure_score is None:
+                        raise
+            return float(self.failure_score)
+
+    async def evaluate(self, solutions):
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        scores = await asyncio.gather(*(self.evaluate_one(solution, semaphore) for solution in np.asarray(solutions, dtype=float)))
+        return np.array(scores, dtype=float)
+
+    def __call__(self, solutions):
+        # Synchronous entry point; inside a running event loop use Optimizer.optimize_async
+        return asyncio.run(self.evaluate(solutions))
+
+
+class CachedEvaluator(Evaluator):
+    # Memoizes another batch evaluator. Solutions are keyed by their coordinates
+    # quantized to a grid of width tolerance (exact coordinates when None), so
+    # nearby points share one score. At most max_size scores are kept, least
+    # recently used first out. Only the misses of a batch, deduplicated, are
+    # passed on to the wrapped evaluator, in a single call.
+    def __init__(self, evaluator, max_size=100000, tolerance=None):
+        self.evaluator = evaluator
+        self.max_size = max_size
+        self.tolerance = tolerance
+        self.scores = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.scores)
+
+    @property
+    def hit_rate(self):
+        return self.hits / max(self.hits + self.misses, 1)
+
+    def __call__(self, solutions):
+        solutions = np.atleast_2d(np.asarray(solutions, dtype=float))
+        keys = solution_keys(solutions, self.tolerance)
+        results = np.empty(len(keys))
+        missing = {}
+        for index, key in enumerate(keys):
+            score = self.scores.get(key)
+            if score is None:
+                missing.setdefault(key, []).append(index)
+            else:
+                self.scores.move_to_end(key)
+                results[index] = score
+        self.hits += len(keys) - len(missing)
+
+        if missing:
+            first = [indices[0] for indices in missing.values()]
+            new_scores = np.asarray(self.evaluator(solutions[first]), dtype=float)
+            self.misses += len(first)
+            for (key, indices), score in zip(missing.items(), new_scores.tolist()):
+                results[indices] = score
+                self.scores[key] = score
+            while len(self.scores) > self.max_size:
+                self.scores.popitem(last=False)
+        return results
@@ -0,0 +1,254 @@
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+
+import numpy as np
+
+from .annealing import SimulatedAnnealing
+from .ant_colony import AntColonySystem
+from .bees import BeesAlgorithm
+from .benchmarks import ALL_FUNCTIONS, BOUNDS, FIXED_DIMENSIONS, FUNCTIONS, optimum
+from .bfoa import BacterialForagingOptimization
+from .pso import ParticleSwarm
+from .restarts import RestartController
+from .tabu import TabuSearch
+from .termination import termination_criteria
+from .trace import ConvergenceTrace
+
+# Default parameters follow the lab scripts. Step-like parameters are given as a
+# fraction of the search domain width so one setting works for every function.
+ALGORITHMS = {
+    'tabu': (TabuSearch, {'max_iterations': 100, 'tabu_size': 10, 'step_size': 0.05, 'num_neighbors': 10}),
+    'sa': (SimulatedAnnealing, {'max_iterations': 1000, 'initial_temperature': 100.0, 'final_temperature': 0.1,
+                                'step_size': 0.05, 'cooling_rate': 0.9}),
+    'pso': (ParticleSwarm, {'num_particles': 50, 'max_iterations': 100, 'inertia_weight': 0.7,
+                            'cognitive_weight': 1.4, 'social_weight': 1.4}),
+    'acs': (AntColonySystem, {'num_ants': 20, 'num_iterations': 100}),
+    'bees': (BeesAlgorithm, {'num_employed_bees': 50, 'num_onlooker_bees': 50, 'max_iterations': 100, 'patch_size': 0.05}),
+    'bfoa': (BacterialForagingOptimization, {'num_bacteria': 50, 'num_iterations': 100, 'chemotactic_step_size': 0.005,
+                                             'swim_length': 0.01, 'tumble_rate': 0.1}),
+}
+
+# Parameters that set the population (batch) size of every engine
+POPULATION_PARAMS = {
+    'tabu': ('num_neighbors',),
+    'sa': ('num_chains',),
+    'pso': ('num_particles',),
+    'acs': ('num_ants',),
+    'bees': ('num_employed_bees', 'num_onlooker_bees'),
+    'bfoa': ('num_bacteria',),
+}
+
+RELATIVE_PARAMS = {'step_size', 'patch_size', 'chemotactic_step_size', 'swim_length'}
+
+SUMMARY_FIELDS = ['algorithm', 'function', 'dimensions', 'params', 'runs', 'mean', 'median', 'std', 'best', 'worst',
+                  'success_rate', 'mean_evaluations', 'mean_time']
+
+
+def make_optimizer(algorithm, function, dimensions, params=None, rng=None):
+    optimizer_class, defaults = ALGORITHMS[algorithm]
+    kwargs = {**defaults, **(params or {})}
+    low, high = BOUNDS[function]
+    for name in RELATIVE_PARAMS & kwargs.keys():
+        kwargs[name] *= high - low
+    return optimizer_class(ALL_FUNCTIONS[function], [low, high], rng=rng, dimensions=dimensions, **kwargs)
+
+
+def population_params(algorithm, population_size):
+    return {name: population_size for name in POPULATION_PARAMS[algorithm]}
+
+
+def restart_optimizer(task, population_size, rng):
+    params = {**task['params'], **population_params(task['algorithm'], population_size)}
+    return make_optimizer(task['algorithm'], task['function'], task['dimensions'], params, rng)
+
+
+def run_restarts(task):
+    # IPOP restarts under the task's evaluation budget, starting from the configured population
+    algorithm = task['algorithm']
+    name = POPULATION_PARAMS[algorithm][0]
+    population_size = task['params'].get(name, ALGORITHMS[algorithm][1].get(name, 1))
+    termination = task['termination']
+    shared = termination_criteria(time_limit=termination.get('time_limit'))
+    controller = RestartController(partial(restart_optimizer, task), termination['max_evaluations'], population_size,
+                                   stagnation=termination.get('stagnation') or 20, termination=shared,
+                                   trace_every=task.get('trace_every'), rng=task['seed'])
+    start = time.perf_counter()
+    best_solution = controller.optimize()
+    elapsed = time.perf_counter() - start
+    trace = None
+    if task.get('trace_every'):
+        # One trace per restart
+        trace = [{field: values.tolist() for field, values in run_trace.arrays().items()} for run_trace in controller.traces]
+    return {
+        **task,
+        'best_score': controller.best_score,
+        'best_solution': np.asarray(best_solution).tolist(),
+        'num_evaluations': controller.num_evaluations,
+        'iterations': controller.iteration,
+        'stop_reason': controller.runs[-1]['stop_reason'],
+        'time': elapsed,
+        'trace': trace,
+        'restart_runs': controller.runs,
+    }
+
+
+def run_experiment(task):
+    if task.get('restarts'):
+        return run_restarts(task)
+    # Each run owns its stream, so results do not depend on which worker ran it
+    optimizer = make_optimizer(task['algorithm'], task['function'], task['dimensions'], task['params'], task['seed'])
+    optimizer.terminate(*termination_criteria(**task.get('termination', {})))
+    if task.get('trace_every'):
+        optimizer.trace = ConvergenceTrace(every=task['trace_every'])
+    start = time.perf_counter()
+    best_solution = optimizer.optimize()
+    elapsed = time.perf_counter() - start
+    trace = None
+    if optimizer.trace is not None:
+        trace = {field: values.tolist() for field, values in optimizer.trace.arrays().items()}
+    return {
+        **task,
+        'best_score': optimizer.best_score,
+        'best_solution': np.asarray(best_solution).tolist(),
+        'num_evaluations': optimizer.num_evaluations,
+        'iterations': optimizer.iteration,
+        'stop_reason': optimizer.stop_reason,
+        'time': elapsed,
+        'trace': trace,
+    }
+
+
+def param_sets(params):
+    # {'a': [1, 2], 'b': 3} -> {'a': 1, 'b': 3}, {'a': 2, 'b': 3}; list values are grid axes
+    axes = [value if isinstance(value, list) else [value] for value in params.values()]
+    for values in itertools.product(*axes):
+        yield dict(zip(params, values))
+
+
+def experiment_grid(algorithms, functions, dimensions, seeds, params, termination=None, trace_every=None, restarts=False):
+    for algorithm, function, num_dimensions in itertools.product(algorithms, functions, dimensions):
+        if FIXED_DIMENSIONS.get(function, num_dimensions) != num_dimensions:
+            continue
+        for param_set, seed in itertools.product(param_sets(params.get(algorithm, {})), seeds):
+            yield {'algorithm': algorithm, 'function': function, 'dimensions': num_dimensions, 'seed': seed,
+                   'params': param_set, 'termination': termination or {},
+                   'trace_every': trace_every, 'restarts': restarts}
+
+
+def run_experiments(tasks, num_workers=None, output=None):
+    # Runs are independent, so each one goes to a pool worker as a whole; results are
+    # appended to the JSONL output as they finish
+    results = []
+    with ProcessPoolExecutor(num_workers) as executor:
+        futures = [executor.submit(run_experiment, task) for task in tasks]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if output is not None:
+                output.write(json.dumps(result) + '\n')
+                output.flush()
+    return results
+
+
+def summarize(results, success_tolerance=1e-3):
+    # One row per configuration; the parameter set is part of it, as canonical JSON
+    groups = {}
+    for result in results:
+        params = json.dumps(result['params'], sort_keys=True)
+        groups.setdefault((result['algorithm'], result['function'], result['dimensions'], params), []).append(result)
+
+    summary = []
+    for (algorithm, function, dimensions, params), runs in sorted(groups.items()):
+        scores = np.array([run['best_score'] for run in runs])
+        target = optimum(function, dimensions)
+        success_rate = None if target is None else float(np.mean(scores - target <= success_tolerance))
+        summary.append({
+            'algorithm': algorithm,
+            'function': function,
+            'dimensions': dimensions,
+            'params': params,
+            'runs': len(runs),
+            'mean': float(np.mean(scores)),
+            'median': float(np.median(scores)),
+            'std': float(np.std(scores)),
+            'best': float(np.min(scores)),
+            'worst': float(np.max(scores)),
+            'success_rate': success_rate,
+            'mean_evaluations': float(np.mean([run['num_evaluations'] for run in runs])),
+            'mean_time': float(np.mean([run['time'] for run in runs])),
+        })
+    return summary
+
+
+def write_summary(summary, path):
+    with open(path, 'w', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=SUMMARY_FIELDS)
+        writer.writeheader()
+        writer.writerows(summary)
+
+
+def parse_params(items):
+    # "pso.num_particles=100" -> {'pso': {'num_particles': 100}}; a JSON list such as
+    # "pso.num_particles=[10,20]" makes the parameter a grid axis
+    params = {}
+    for item in items:
+        key, value = item.split('=', 1)
+        algorithm, name = key.split('.', 1)
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError:
+            pass
+        params.setdefault(algorithm, {})[name] = value
+    return params
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m metody_si.experiments',
+                                     description='Run a grid of optimizer experiments in parallel.')
+    parser.add_argument('--algorithms', nargs='+', default=list(ALGORITHMS), choices=list(ALGORITHMS))
+    parser.add_argument('--functions', nargs='+', default=list(FUNCTIONS), choices=list(ALL_FUNCTIONS))
+    parser.add_argument('--dimensions', nargs='+', type=int, default=[2])
+    parser.add_argument('--seeds', type=int, default=30, help='number of seeds per configuration')
+    parser.add_argument('--first-seed', type=int, default=0)
+    parser.add_argument('--param', action='append', default=[], metavar='ALGORITHM.NAME=VALUE',
+                        help='override an algorithm parameter, e.g. pso.num_particles=100; '
+                             'a list such as pso.num_particles=[10,20] runs every value')
+    parser.add_argument('--max-evaluations', type=int, help='evaluation budget shared by every algorithm')
+    parser.add_argument('--time-limit', type=float, help='wall-clock limit per run in seconds')
+    parser.add_argument('--stagnation', type=int, metavar='ITERATIONS', help='stop after this many iterations without improvement')
+    parser.add_argument('--restarts', action='store_true',
+                        help='restart stagnating runs with growing populations (needs --max-evaluations)')
+    parser.add_argument('--trace-every', type=int, metavar='BATCHES', help='store a convergence trace with every run')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--output', default='results.jsonl', help='per-run results (JSON lines)')
+    parser.add_argument('--summary', default='summary.csv', help='per-configuration statistics (CSV)')
+    parser.add_argument('--success-tolerance', type=float, default=1e-3)
+    args = parser.parse_args(argv)
+    if args.restarts and args.max_evaluations is None:
+        parser.error('--restarts needs --max-evaluations')
+
+    seeds = range(args.first_seed, args.first_seed + args.seeds)
+    termination = {'max_evaluations': args.max_evaluations, 'time_limit': args.time_limit, 'stagnation': args.stagnation}
+    tasks = list(experiment_grid(args.algorithms, args.functions, args.dimensions, seeds, parse_params(args.param), termination,
+                                 args.trace_every, args.restarts))
+    print('Running %d experiments on %d workers' % (len(tasks), args.workers), file=sys.stderr)
+    with open(args.output, 'w') as output:
+        results = run_experiments(tasks, args.workers, output)
+    summary = summarize(results, args.success_tolerance)
+    write_summary(summary, args.summary)
+
+    for row in summary:
+        print('%-5s %-13s D=%-3d mean=%-12.6g median=%-12.6g std=%-10.4g best=%-12.6g success=%s %s' % (
+            row['algorithm'], row['function'], row['dimensions'], row['mean'], row['median'], row['std'], row['best'],
+            '-' if row['success_rate'] is None else '%.2f' % row['success_rate'], row['params']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+import multiprocessing
+
+import numpy as np
+
+from .benchmarks import as_batch
+
+
+def ring(num_islands):
+    # Island i receives from island i - 1
+    return [[(i - 1) % num_islands] for i in range(num_islands)]
+
+
+def complete(num_islands):
+    return [[j for j in range(num_islands) if j != i] for i in range(num_islands)]
+
+
+def star(num_islands):
+    # Island 0 is the hub: it receives from every island and sends to every island
+    return [list(range(1, num_islands))] + [[0] for _ in range(1, num_islands)]
+
+
+TOPOLOGIES = {
+    'ring': ring,
+    'complete': complete,
+    'star': star,
+}
+
+
+def _run_island(connection, optimizer, migration_interval, num_migrants, evaluator):
+    # Worker loop: run migration_interval iterations, report emigrants, wait for
+    # immigrants (None means stop) and finally send back the optimizer
+    evaluate = as_batch(optimizer.objective_func) if evaluator is None else evaluator
+    while True:
+        epoch_end = optimizer.iteration + migration_interval
+        while not optimizer.terminated() and optimizer.iteration < epoch_end:
+            solutions = optimizer.ask()
+            optimizer.tell(evaluate(solutions) if len(solutions) else np.empty(0))
+        connection.send((optimizer.terminated(), *optimizer.emigrants(num_migrants)))
+        immigrants = connection.recv()
+        if immigrants is None:
+            break
+        optimizer.immigrate(*immigrants)
+    connection.send(optimizer)
+    connection.close()
+
+
+class IslandModel:
+    # Coarse-grained parallelism: every island is an independent Optimizer (any
+    # engine, any mix) running in its own process. Every migration_interval
+    # iterations the islands send their num_migrants best individuals to this
+    # process over a pipe, which forwards them along the topology; incoming
+    # individuals replace the worst residents they beat. Epochs are synchronous,
+    # so a seeded run is reproducible. Give every island its own stream, e.g. from
+    # spawn_generators(seed, num_islands).
+    def __init__(self, islands, migration_interval=10, num_migrants=2, topology='ring', evaluator=None):
+        self.islands = list(islands)
+        self.migration_interval = migration_interval
+        self.num_migrants = num_migrants
+        topology = TOPOLOGIES.get(topology, topology)
+        self.neighbors = topology(len(self.islands)) if callable(topology) else topology
+        self.evaluator = evaluator  # Run inside each island process; None uses the island's objective
+        self.best_solution = None
+        self.best_score = float('inf')
+        self.num_migrations = 0
+
+    @property
+    def num_evaluations(self):
+        return sum(island.num_evaluations for island in self.islands)
+
+    def optimize(self):
+        context = multiprocessing.get_context()
+        connections, processes = [], []
+        for island in self.islands:
+            parent, child = context.Pipe()
+            process = context.Process(target=_run_island,
+                                      args=(child, island, self.migration_interval, self.num_migrants, self.evaluator))
+            process.start()
+            child.close()
+            connections.append(parent)
+            processes.append(process)
+
+        try:
+            active = set(range(len(self.islands)))
+            latest = [None] * len(self.islands)
+            while active:
+                finished = set()
+                for index in sorted(active):
+                    done, solutions, scores = connections[index].recv()
+                    latest[index] = (solutions, scores)
+                    if done:
+                        finished.add(index)
+                active -= finished
+                for index in finished:
+                    connections[index].send(None)
+                for index in sorted(active):
+                    # Finished islands keep donating their last emigrants
+                    incoming = [latest[source] for source in self.neighbors[index] if latest[source] is not None]
+                    if incoming:
+                        solutions = np.concatenate([solutions for solutions, _ in incoming])
+                        scores = np.concatenate([scores for _, scores in incoming])
+                    else:
+                        solutions, scores = np.empty((0, self.islands[index].dimensions)), np.empty(0)
+                    connections[index].send((solutions, scores))
+                self.num_migrations += bool(active)
+
+            self.islands = [connection.recv() for connection in connections]
+        finally:
+            for connection in connections:
+                connection.close()
+            for process in processes:
+                process.join()
+
+        for island in self.islands:
+            if island.best_score < self.best_score:
+                self.best_solution, self.best_score = island.best_solution, island.best_score
+        return self.best_solution
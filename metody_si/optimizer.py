@@ -0,0 +1,168 @@
+import time
+
+import numpy as np
+
+from .benchmarks import as_batch
+from .checkpoint import save_checkpoint
+
+
+def spawn_generators(seed, num_generators):
+    # Independent streams for workers, islands or restarts, spawned from a seed,
+    # SeedSequence or Generator; the same seed always yields the same streams
+    if isinstance(seed, np.random.Generator):
+        seed = seed.bit_generator.seed_seq
+    elif not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return [np.random.default_rng(child) for child in seed.spawn(num_generators)]
+
+
+class Optimizer:
+    # Common batched ask/tell interface. ask() returns an (N, D) array of solutions
+    # to score and tell() takes their (N,) scores; the two always alternate, so any
+    # evaluation backend (a callable mapping (N, D) to (N,)) can drive any engine.
+    # Subclasses implement generate(), update() and done(); extra stopping rules
+    # shared by every engine (see termination.py) are added with terminate().
+    # All randomness comes from self.rng; rng accepts a seed, a SeedSequence or a
+    # numpy Generator, and None draws fresh entropy.
+    # bounds is a (lower, upper) pair of scalars or (D,) arrays; both are stored as
+    # (D,) arrays in self.lower and self.upper (self.bounds holds the same pair).
+    # The problem size is dimensions, or the length of array bounds; scalar bounds
+    # without dimensions raise ValueError rather than guessing.
+    def __init__(self, objective_func, bounds, rng=None, dimensions=None):
+        self.objective_func = objective_func
+        lower, upper = (np.asarray(bound, dtype=float) for bound in bounds)
+        if dimensions is None:
+            if not (lower.ndim or upper.ndim):
+                raise ValueError('scalar bounds need an explicit dimensions=...')
+            dimensions = max(lower.size, upper.size)
+        self.dimensions = dimensions
+        self.lower = np.broadcast_to(lower, (dimensions,)).copy()
+        self.upper = np.broadcast_to(upper, (dimensions,)).copy()
+        if np.any(self.lower > self.upper):
+            raise ValueError('every lower bound must not exceed its upper bound')
+        self.bounds = (self.lower, self.upper)
+        self.rng = np.random.default_rng(rng)
+        self.best_solution = None
+        self.best_score = float('inf')
+        self.iteration = 0
+        self.num_evaluations = 0
+        self.pending = None
+        self.initial_solutions = None
+        self.termination = []
+        self.stop_reason = None
+        self.trace = None  # Optional ConvergenceTrace
+
+    def ask(self):
+        if self.pending is None:
+            self.pending = self.generate()
+        return self.pending
+
+    def tell(self, scores):
+        solutions = self.pending
+        scores = np.asarray(scores, dtype=float)
+        if solutions is None or len(scores) != len(solutions):
+            raise ValueError('tell() expects one score per solution returned by ask()')
+        self.pending = None
+        self.num_evaluations += len(scores)
+        # The engine sees the best score from before this batch (tabu aspiration relies on it)
+        self.update(solutions, scores)
+        self.update_best(solutions, scores)
+        if self.trace is not None:
+            self.trace.record(self, solutions, scores)
+
+    def warm_start(self, solutions):
+        # Seeds the initial population, e.g. with PersistentEvaluator.best(...)
+        self.initial_solutions = np.atleast_2d(np.asarray(solutions, dtype=float))
+
+    def initial_population(self, num_solutions):
+        population = self.rng.uniform(self.lower, self.upper, size=(num_solutions, self.dimensions))
+        if self.initial_solutions is not None:
+            count = min(num_solutions, len(self.initial_solutions))
+            population[:count] = self.initial_solutions[:count]
+        return population
+
+    def terminate(self, *criteria):
+        self.termination.extend(criteria)
+        return self
+
+    def terminated(self):
+        # The engine's own schedule or the first user criterion that fires
+        if self.done():
+            self.stop_reason = 'done'
+            return True
+        for criterion in self.termination:
+            if criterion(self):
+                self.stop_reason = criterion.reason
+                return True
+        return False
+
+    def generate(self):
+        raise NotImplementedError
+
+    def update(self, solutions, scores):
+        raise NotImplementedError
+
+    def done(self):
+        raise NotImplementedError
+
+    def population(self):
+        # (solutions, scores) arrays of the individuals migration reads and replaces
+        raise NotImplementedError
+
+    def replace(self, indices, solutions, scores):
+        raise NotImplementedError
+
+    def emigrants(self, num_migrants):
+        solutions, scores = self.population()
+        if scores is None:
+            return np.empty((0, self.dimensions)), np.empty(0)
+        best = np.argsort(scores, kind='stable')[:num_migrants]
+        return solutions[best].copy(), scores[best].copy()
+
+    def immigrate(self, solutions, scores):
+        # Incoming individuals replace the worst residents they beat. Called between
+        # batches, e.g. by IslandModel.
+        residents, resident_scores = self.population()
+        if resident_scores is None or len(scores) == 0:
+            return
+        incoming = np.argsort(scores, kind='stable')[:len(resident_scores)]
+        worst = np.argsort(resident_scores, kind='stable')[::-1][:incoming.size]
+        better = scores[incoming] < resident_scores[worst]
+        self.replace(worst[better], solutions[incoming[better]], scores[incoming[better]])
+        self.update_best(solutions, scores)
+
+    def update_best(self, solutions, scores):
+        if len(scores) == 0:
+            return
+        best_index = np.argmin(scores)
+        if scores[best_index] < self.best_score:
+            self.best_solution = np.array(solutions[best_index], dtype=float)
+            self.best_score = float(scores[best_index])
+
+    def optimize(self, evaluator=None, checkpoint=None, checkpoint_interval=60.0):
+        # With a checkpoint path the full state is saved between batches at most every
+        # checkpoint_interval seconds and at the end; see checkpoint.resume()
+        evaluate = as_batch(self.objective_func) if evaluator is None else evaluator
+        last_checkpoint = time.monotonic()
+        while not self.terminated():
+            if checkpoint is not None and time.monotonic() - last_checkpoint >= checkpoint_interval:
+                save_checkpoint(self, checkpoint)
+                last_checkpoint = time.monotonic()
+            solutions = self.ask()
+            self.tell(evaluate(solutions) if len(solutions) else np.empty(0))
+        if checkpoint is not None:
+            save_checkpoint(self, checkpoint)
+        return self.best_solution
+
+    async def optimize_async(self, evaluator, checkpoint=None, checkpoint_interval=60.0):
+        # evaluator.evaluate is a coroutine, e.g. AsyncEvaluator
+        last_checkpoint = time.monotonic()
+        while not self.terminated():
+            if checkpoint is not None and time.monotonic() - last_checkpoint >= checkpoint_interval:
+                save_checkpoint(self, checkpoint)
+                last_checkpoint = time.monotonic()
+            solutions = self.ask()
+            self.tell(await evaluator.evaluate(solutions) if len(solutions) else np.empty(0))
+        if checkpoint is not None:
+            save_checkpoint(self, checkpoint)
+        return self.best_solution
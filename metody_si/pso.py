@@ -0,0 +1,144 @@
+from concurrent.futures import FIRST_COMPLETED, wait
+
+import numpy as np
+
+from .evaluation import PoolEvaluator
+from .optimizer import Optimizer
+
+
+class ParticleSwarm(Optimizer):
+    # The whole swarm is kept as contiguous (num_particles, num_dimensions) arrays
+    def __init__(self, objective_func, bounds, num_particles, max_iterations, inertia_weight, cognitive_weight, social_weight, rng=None, dimensions=None):
+        super().__init__(objective_func, bounds, rng, dimensions)
+        self.num_particles = num_particles
+        self.max_iterations = max_iterations
+        self.inertia_weight = inertia_weight
+        self.cognitive_weight = cognitive_weight
+        self.social_weight = social_weight
+        self.positions = None
+        self.velocities = None
+        self.best_positions = None
+        self.best_scores = None
+
+    def generate(self):
+        shape = (self.num_particles, self.dimensions)
+        if self.positions is None:
+            self.positions = self.initial_population(self.num_particles)
+            self.velocities = self.rng.uniform(-1, 1, size=shape)
+            return self.positions
+
+        r1, r2 = self.rng.random((2, self.num_particles, 1))
+
+        pull = np.subtract(self.best_positions, self.positions)
+        pull *= self.cognitive_weight * r1
+        self.velocities *= self.inertia_weight
+        self.velocities += pull
+        np.subtract(self.best_solution, self.positions, out=pull)
+        pull *= self.social_weight * r2
+        self.velocities += pull
+
+        self.positions += self.velocities
+        np.clip(self.positions, self.lower, self.upper, out=self.positions)
+        return self.positions
+
+    def update(self, solutions, scores):
+        # Each position is scored exactly once per iteration
+        if self.best_positions is None:
+            self.best_positions = solutions.copy()
+            self.best_scores = scores.copy()
+            return
+
+        improved = scores < self.best_scores
+        self.best_positions[improved] = solutions[improved]
+        self.best_scores[improved] = scores[improved]
+        self.iteration += 1
+
+    def done(self):
+        return self.iteration >= self.max_iterations
+
+    def population(self):
+        return self.best_positions, self.best_scores
+
+    def replace(self, indices, solutions, scores):
+        self.positions[indices] = solutions
+        self.velocities[indices] = 0
+        self.best_positions[indices] = solutions
+        self.best_scores[indices] = scores
+
+
+class SteadyStateParticleSwarm(ParticleSwarm):
+    # Asynchronous PSO: every particle has one evaluation in flight on a worker pool
+    # and is moved and re-dispatched as soon as that evaluation returns, using the
+    # global best known at that moment. No particle waits for the slowest one.
+    # The budget matches the synchronous swarm: num_particles * (max_iterations + 1).
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Coefficients are drawn a swarm's worth at a time rather than two per move
+        self.coefficients = np.empty((0, 2))
+        self.next_coefficient = 0
+
+    def move_particle(self, index):
+        if self.next_coefficient == len(self.coefficients):
+            self.coefficients = self.rng.random((self.num_particles, 2))
+            self.next_coefficient = 0
+        r1, r2 = self.coefficients[self.next_coefficient]
+        self.next_coefficient += 1
+        position = self.positions[index]
+        velocity = self.velocities[index]
+        velocity *= self.inertia_weight
+        velocity += self.cognitive_weight * r1 * (self.best_positions[index] - position)
+        velocity += self.social_weight * r2 * (self.best_solution - position)
+        position += velocity
+        np.clip(position, self.lower, self.upper, out=position)
+        return position.copy()
+
+    def update_particle(self, index, solution, score):
+        self.num_evaluations += 1
+        self.iteration = self.num_evaluations // self.num_particles - 1
+        if score < self.best_scores[index]:
+            self.best_positions[index] = solution
+            self.best_scores[index] = score
+        self.update_best(solution[np.newaxis, :], np.array([score]))
+        if self.trace is not None and self.num_evaluations % self.num_particles == 0 and np.isfinite(self.best_scores).all():
+            # One record per swarm-sized block of evaluations, once every particle has a score
+            self.trace.record(self, self.positions, self.best_scores)
+
+    def optimize(self, evaluator=None):
+        # evaluator must provide submit(solutions) -> Future, like PoolEvaluator
+        if evaluator is None:
+            with PoolEvaluator(self.objective_func) as pool:
+                return self.optimize(pool)
+
+        shape = (self.num_particles, self.dimensions)
+        self.positions = self.initial_population(self.num_particles)
+        self.velocities = self.rng.uniform(-1, 1, size=shape)
+        self.best_positions = self.positions.copy()
+        self.best_scores = np.full(self.num_particles, np.inf)
+        budget = self.num_particles * (self.max_iterations + 1)
+
+        in_flight = {}
+        for index in range(self.num_particles):
+            solution = self.positions[index].copy()
+            in_flight[evaluator.submit(solution)] = (index, solution)
+        submitted = self.num_particles
+
+        while in_flight:
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                index, solution = in_flight.pop(future)
+                self.update_particle(index, solution, float(future.result()[0]))
+                if submitted < budget and not self.terminated():
+                    solution = self.move_particle(index)
+                    in_flight[evaluator.submit(solution)] = (index, solution)
+                    submitted += 1
+
+        if self.stop_reason is None:
+            # The budget ran out before any criterion fired; record why the run ended
+            self.terminated()
+        return self.best_solution
+
+
+def particle_swarm_optimization(objective_func, bounds, num_particles, max_iterations, inertia_weight, cognitive_weight, social_weight, rng=None,
+                                dimensions=None):
+    swarm = ParticleSwarm(objective_func, bounds, num_particles, max_iterations, inertia_weight, cognitive_weight, social_weight, rng, dimensions)
+    return swarm.optimize()
@@ -0,0 +1,69 @@
+import numpy as np
+
+from .benchmarks import as_batch
+from .optimizer import spawn_generators
+from .termination import LowDiversity, MaxEvaluations, Stagnation, TargetScore
+from .trace import ConvergenceTrace
+
+
+class RestartController:
+    # IPOP-style restarts: factory(population_size, rng) builds a fresh engine, which
+    # runs until it stagnates (no improvement of best_score for stagnation
+    # iterations), its population collapses (LowDiversity) or its own schedule ends.
+    # The next run gets population_size * growth individuals and a new stream
+    # spawned from rng. All runs share max_evaluations and happen in this process;
+    # the best solution over all runs is kept. Criteria in termination (e.g. a
+    # Deadline) are shared by all runs and end the whole sequence when they fire.
+    # With trace_every every run records its own ConvergenceTrace in self.traces.
+    def __init__(self, factory, max_evaluations, population_size, growth=2.0, stagnation=20, tolerance=1e-8,
+                 min_diversity=1e-6, target_score=None, termination=(), trace_every=None, rng=None):
+        self.factory = factory
+        self.max_evaluations = max_evaluations
+        self.population_size = population_size
+        self.growth = growth
+        self.stagnation = stagnation
+        self.tolerance = tolerance
+        self.min_diversity = min_diversity
+        self.target_score = target_score
+        self.termination = list(termination)
+        self.trace_every = trace_every
+        if isinstance(rng, np.random.Generator):
+            rng = rng.bit_generator.seed_seq
+        self.seed_sequence = rng if isinstance(rng, np.random.SeedSequence) else np.random.SeedSequence(rng)
+        self.best_solution = None
+        self.best_score = float('inf')
+        self.num_evaluations = 0
+        self.runs = []
+        self.traces = []
+
+    @property
+    def iteration(self):
+        return sum(run['iterations'] for run in self.runs)
+
+    def optimize(self, evaluator=None):
+        size = self.population_size
+        while self.num_evaluations < self.max_evaluations:
+            optimizer = self.factory(int(size), spawn_generators(self.seed_sequence, 1)[0])
+            optimizer.terminate(MaxEvaluations(self.max_evaluations - self.num_evaluations),
+                                Stagnation(self.stagnation, self.tolerance),
+                                LowDiversity(self.min_diversity))
+            if self.target_score is not None:
+                optimizer.terminate(TargetScore(self.target_score))
+            optimizer.terminate(*self.termination)
+            if self.trace_every:
+                optimizer.trace = ConvergenceTrace(every=self.trace_every)
+            optimizer.optimize(as_batch(optimizer.objective_func) if evaluator is None else evaluator)
+
+            self.num_evaluations += optimizer.num_evaluations
+            self.runs.append({'population_size': int(size), 'evaluations': optimizer.num_evaluations,
+                              'iterations': optimizer.iteration, 'best_score': optimizer.best_score,
+                              'stop_reason': optimizer.stop_reason})
+            if optimizer.trace is not None:
+                self.traces.append(optimizer.trace)
+            if optimizer.best_score < self.best_score:
+                self.best_solution, self.best_score = optimizer.best_solution, optimizer.best_score
+            final = {'max_evaluations', 'target_score'} | {criterion.reason for criterion in self.termination}
+            if optimizer.stop_reason in final or optimizer.num_evaluations == 0:
+                break
+            size *= self.growth
+        return self.best_solution
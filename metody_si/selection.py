@@ -0,0 +1,47 @@
+import numpy as np
+
+# Selection strategies for minimisation: lower scores are fitter. Every strategy
+# samples with replacement and returns num_selected indices into scores, drawing
+# from rng (a Generator or a seed).
+
+
+def fitness(scores):
+    # Standard ABC fitness transform, positive and decreasing in the score
+    scores = np.asarray(scores, dtype=float)
+    return np.where(scores >= 0, 1 / (1 + np.abs(scores)), 1 + np.abs(scores))
+
+
+def sample_weights(weights, num_selected, rng=None):
+    # Cumulative-sum roulette: O(N) setup and O(log N) per draw
+    rng = np.random.default_rng(rng)
+    cumulative = np.cumsum(weights)
+    draws = rng.uniform(0, cumulative[-1], size=num_selected)
+    return np.minimum(np.searchsorted(cumulative, draws, side='right'), len(cumulative) - 1)
+
+
+def roulette_selection(scores, num_selected, rng=None):
+    return sample_weights(fitness(scores), num_selected, rng)
+
+
+def rank_selection(scores, num_selected, pressure=1.5, rng=None):
+    # Linear ranking: the best gets pressure / N of the mass, the worst (2 - pressure) / N
+    n = len(scores)
+    ranks = np.empty(n)
+    ranks[np.argsort(scores, kind='stable')] = np.arange(n)
+    weights = pressure - (2 * pressure - 2) * ranks / max(n - 1, 1)
+    return sample_weights(weights, num_selected, rng)
+
+
+def tournament_selection(scores, num_selected, tournament_size=2, rng=None):
+    rng = np.random.default_rng(rng)
+    scores = np.asarray(scores)
+    entrants = rng.integers(len(scores), size=(num_selected, tournament_size))
+    winners = np.argmin(scores[entrants], axis=1)
+    return entrants[np.arange(num_selected), winners]
+
+
+SELECTIONS = {
+    'roulette': roulette_selection,
+    'rank': rank_selection,
+    'tournament': tournament_selection,
+}
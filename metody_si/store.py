@@ -0,0 +1,138 @@
+import os
+import sqlite3
+import types
+
+import numpy as np
+
+from .benchmarks import ScalarFunction
+from .evaluation import Evaluator, solution_keys
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS evaluations (
+    objective TEXT NOT NULL,
+    key BLOB NOT NULL,
+    solution BLOB NOT NULL,
+    score REAL NOT NULL,
+    PRIMARY KEY (objective, key)
+);
+CREATE INDEX IF NOT EXISTS evaluations_by_score ON evaluations (objective, score);
+'''
+
+# SQLite limits the number of bound parameters per statement
+LOOKUP_CHUNK = 500
+
+
+def objective_name(objective_func):
+    # Name of the innermost objective behind a chain of evaluators, so every
+    # wrapping of one function shares its stored scores. Only module-level
+    # functions have a name that identifies them; lambdas, closures, partials and
+    # callable objects raise ValueError and need an explicit objective= name.
+    while True:
+        inner = getattr(objective_func, 'evaluator', None)
+        if inner is None:
+            inner = getattr(objective_func, 'objective_func', None)
+        if inner is None:
+            break
+        objective_func = inner
+    if isinstance(objective_func, ScalarFunction):
+        # f and f.batch are one objective
+        objective_func = objective_func.batch
+    qualname = getattr(objective_func, '__qualname__', '')
+    if not isinstance(objective_func, (types.FunctionType, types.BuiltinFunctionType)) or '<' in qualname:
+        raise ValueError('no unique name for objective %r; pass objective= explicitly' % (objective_func,))
+    return '%s.%s' % (objective_func.__module__, qualname)
+
+
+class PersistentEvaluator(Evaluator):
+    # Disk-backed memo of another batch evaluator, shared across runs and processes.
+    # Scores live in an SQLite database in WAL mode, keyed by the objective's name
+    # and the (optionally quantized) coordinates. Keys start with the quantization
+    # ('exact' or the cell width), so runs with different tolerances can share one
+    # file without matching each other's cells. Every process opens its own
+    # connection, so instances can be pickled to pool workers.
+    def __init__(self, evaluator, path, objective=None, tolerance=None, timeout=60.0):
+        self.evaluator = evaluator
+        self.path = path
+        self.objective = objective or objective_name(evaluator)
+        self.tolerance = tolerance
+        self.key_prefix = ('%r:' % float(tolerance) if tolerance else 'exact:').encode()
+        self.timeout = timeout
+        self.hits = 0
+        self.misses = 0
+        self._connection = None
+        self._pid = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_connection'] = None
+        return state
+
+    def __len__(self):
+        (count,) = self.connection.execute('SELECT COUNT(*) FROM evaluations WHERE objective = ?', (self.objective,)).fetchone()
+        return count
+
+    @property
+    def connection(self):
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.executescript(SCHEMA)
+            self._pid = os.getpid()
+        return self._connection
+
+    def lookup(self, keys):
+        found = {}
+        for start in range(0, len(keys), LOOKUP_CHUNK):
+            chunk = keys[start:start + LOOKUP_CHUNK]
+            query = 'SELECT key, score FROM evaluations WHERE objective = ? AND key IN (%s)' % ', '.join('?' * len(chunk))
+            found.update(self.connection.execute(query, (self.objective, *chunk)))
+        return found
+
+    def save(self, keys, solutions, scores):
+        rows = [(self.objective, key, solution.tobytes(), score) for key, solution, score in zip(keys, solutions, scores)]
+        connection = self.connection
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            connection.executemany('INSERT OR IGNORE INTO evaluations VALUES (?, ?, ?, ?)', rows)
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+
+    def __call__(self, solutions):
+        solutions = np.atleast_2d(np.asarray(solutions, dtype=float))
+        keys = [self.key_prefix + key for key in solution_keys(solutions, self.tolerance)]
+        found = self.lookup(list(set(keys)))
+        results = np.empty(len(keys))
+        missing = {}
+        for index, key in enumerate(keys):
+            if key in found:
+                results[index] = found[key]
+            else:
+                missing.setdefault(key, []).append(index)
+        self.hits += len(keys) - len(missing)
+
+        if missing:
+            first = [indices[0] for indices in missing.values()]
+            new_scores = np.asarray(self.evaluator(solutions[first]), dtype=float)
+            self.misses += len(first)
+            for indices, score in zip(missing.values(), new_scores.tolist()):
+                results[indices] = score
+            self.save(list(missing), solutions[first], new_scores.tolist())
+        return results
+
+    def best(self, num_solutions, dimensions):
+        # The num_solutions best stored points of the given dimension, for Optimizer.warm_start
+        rows = self.connection.execute(
+            # A point stored under several tolerances is returned once
+            'SELECT solution, MIN(score) AS score FROM evaluations WHERE objective = ? AND length(solution) = ? '
+            'GROUP BY solution ORDER BY score LIMIT ?',
+            (self.objective, 8 * dimensions, num_solutions)).fetchall()
+        solutions = np.array([np.frombuffer(solution, dtype=float) for solution, _ in rows]).reshape(-1, dimensions)
+        scores = np.array([score for _, score in rows], dtype=float)
+        return solutions, scores
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -0,0 +1,173 @@
+import numpy as np
+
+from .optimizer import Optimizer
+
+
+class TabuMemory:
+    # Ring buffer of the last tabu_size solutions plus a spatial hash over them. A
+    # solution is tabu when a stored one lies within tolerance of it on every
+    # coordinate; tolerance=0 matches identical coordinates only. Cells are
+    # tolerance * max(2, dimensions) wide, so a query probes its own cell plus the
+    # adjacent cell on each coordinate within tolerance of a cell edge (about two
+    # coordinates on average), and every hit is confirmed against the stored
+    # coordinates. Queries near more than MAX_EDGE_PROBES edges scan the buffer.
+    # tabu_size=0 keeps no memory: nothing is ever tabu.
+    #
+    # The hash table is kept in arrays so a whole neighborhood is filtered with a
+    # few numpy operations: each table entry heads a chain of ring slots, newest
+    # first. Every slot carries the stamp of its insertion and every link the stamp
+    # it expects, so overwriting a slot silently cuts the links to it.
+    MAX_EDGE_PROBES = 10
+
+    def __init__(self, tabu_size, dimensions, tolerance=1e-3):
+        self.tabu_size = tabu_size
+        self.dimensions = dimensions
+        self.tolerance = tolerance
+        self.cell_size = tolerance * max(2, dimensions)
+        self.solutions = np.empty((tabu_size, dimensions))
+        self.stamps = np.zeros(tabu_size, dtype=np.int64)
+        self.next_slots = np.zeros(tabu_size, dtype=np.int64)
+        self.next_stamps = np.full(tabu_size, -1, dtype=np.int64)
+        table_size = 1 << max(1, 2 * tabu_size - 1).bit_length()
+        self.mask = table_size - 1
+        self.table_slots = np.zeros(table_size, dtype=np.int64)
+        self.table_stamps = np.full(table_size, -1, dtype=np.int64)
+        self.num_added = 0
+        self.head = 0
+        self.size = 0
+        self.weights = np.random.default_rng(dimensions).integers(1, 2**62, size=dimensions) | 1
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, solution):
+        return bool(self.contains(solution)[0])
+
+    def cells(self, solutions):
+        if self.tolerance:
+            return np.floor(solutions / self.cell_size).astype(np.int64)
+        # Adding 0.0 turns -0.0 into 0.0 before the bits are compared
+        return np.ascontiguousarray(solutions + 0.0).view(np.int64)
+
+    def hash(self, cells):
+        # Wrapping int64 arithmetic is intended here
+        return (cells * self.weights).sum(axis=-1)
+
+    def candidate_keys(self, solutions):
+        # The hashes of every cell a match could be stored in, as flat (rows, keys)
+        # arrays, plus a mask of the rows near too many cell edges, which must scan
+        # the whole buffer instead
+        if not self.tolerance:
+            return np.arange(len(solutions)), self.hash(self.cells(solutions)), np.zeros(len(solutions), dtype=bool)
+        low = self.cells(solutions - self.tolerance)
+        # cell_size >= 2 * tolerance, so high - low is 0 or 1 on each coordinate
+        edges = self.cells(solutions + self.tolerance) != low
+        scan = edges.sum(axis=1) > self.MAX_EDGE_PROBES
+        rows = np.flatnonzero(~scan)
+        keys = self.hash(low[rows])
+        # Doubling per coordinate: rows near an edge of it also probe the next cell
+        for coordinate in np.flatnonzero(edges[rows].any(axis=0)):
+            near = edges[rows, coordinate]
+            rows = np.concatenate([rows, rows[near]])
+            keys = np.concatenate([keys, keys[near] + self.weights[coordinate]])
+        return rows, keys, scan
+
+    def contains(self, solutions):
+        solutions = np.atleast_2d(np.asarray(solutions, dtype=float))
+        found = np.zeros(len(solutions), dtype=bool)
+        if not self.size:
+            return found
+        rows, keys, scan = self.candidate_keys(solutions)
+        indices = keys & self.mask
+        slots = self.table_slots[indices]
+        valid = self.stamps[slots] == self.table_stamps[indices]
+        while valid.any():
+            rows, slots = rows[valid], slots[valid]
+            distances = np.abs(self.solutions[slots] - solutions[rows]).max(axis=1)
+            found[rows[distances <= self.tolerance]] = True
+            # Follow each chain one link, dropping rows already known to be tabu
+            next_slots = self.next_slots[slots]
+            valid = (self.stamps[next_slots] == self.next_stamps[slots]) & ~found[rows]
+            slots = next_slots
+        for index in np.flatnonzero(scan):
+            distances = np.abs(self.solutions[:self.size] - solutions[index]).max(axis=1)
+            found[index] = distances.min() <= self.tolerance
+        return found
+
+    def add(self, solution):
+        if not self.tabu_size:
+            return
+        solution = np.asarray(solution, dtype=float)
+        index = int(self.hash(self.cells(solution[np.newaxis, :]))[0]) & self.mask
+        self.num_added += 1
+        slot = self.head
+        self.solutions[slot] = solution
+        self.stamps[slot] = self.num_added
+        self.next_slots[slot] = self.table_slots[index]
+        self.next_stamps[slot] = self.table_stamps[index]
+        self.table_slots[index] = slot
+        self.table_stamps[index] = self.num_added
+        self.size = min(self.size + 1, self.tabu_size)
+        self.head = (self.head + 1) % self.tabu_size
+
+
+def generate_neighborhood(solution, bounds, step_size, num_neighbors, rng=None):
+    rng = np.random.default_rng(rng)
+    low = np.maximum(bounds[0], solution - step_size)
+    high = np.minimum(bounds[1], solution + step_size)
+    return rng.uniform(low, high, size=(num_neighbors, len(solution)))
+
+
+class TabuSearch(Optimizer):
+    def __init__(self, objective_func, bounds, max_iterations, tabu_size, step_size, num_neighbors=10, tolerance=1e-3, rng=None,
+                 dimensions=None):
+        super().__init__(objective_func, bounds, rng, dimensions)
+        self.max_iterations = max_iterations
+        self.step_size = step_size
+        self.num_neighbors = num_neighbors
+        self.tabu_list = TabuMemory(tabu_size, self.dimensions, tolerance)
+        self.current_solution = None
+        self.current_score = None
+
+    def generate(self):
+        if self.current_solution is None:
+            return self.initial_population(1)
+        return generate_neighborhood(self.current_solution, self.bounds, self.step_size, self.num_neighbors, self.rng)
+
+    def update(self, solutions, scores):
+        if self.current_solution is None:
+            self.current_solution = solutions[0].copy()
+            self.current_score = scores[0]
+            self.tabu_list.add(self.current_solution)
+            return
+
+        self.iteration += 1
+        # Aspiration: a tabu neighbor is still admissible if it beats the best score
+        admissible = ~self.tabu_list.contains(solutions) | (scores < self.best_score)
+        if not admissible.any():
+            return
+
+        best_index = np.argmin(np.where(admissible, scores, np.inf))
+        self.current_solution = solutions[best_index].copy()
+        self.current_score = scores[best_index]
+        self.tabu_list.add(self.current_solution)
+
+    def done(self):
+        return self.iteration >= self.max_iterations
+
+    def population(self):
+        if self.current_solution is None:
+            return None, None
+        return self.current_solution[np.newaxis, :], np.array([self.current_score])
+
+    def replace(self, indices, solutions, scores):
+        if len(indices):
+            self.current_solution = solutions[0].copy()
+            self.current_score = scores[0]
+            self.tabu_list.add(self.current_solution)
+
+
+def tabu_search(objective_func, bounds, max_iterations, tabu_size, step_size, num_neighbors=10, tolerance=1e-3, rng=None,
+                dimensions=None):
+    search = TabuSearch(objective_func, bounds, max_iterations, tabu_size, step_size, num_neighbors, tolerance, rng, dimensions)
+    return search.optimize()
@@ -0,0 +1,116 @@
+import time
+
+import numpy as np
+
+
+class Termination:
+    # A stopping rule checked by Optimizer.terminated() between batches. Engines
+    # count different things per iteration, so rules look only at state every
+    # Optimizer shares: num_evaluations, best_score, iteration and population().
+    reason = None
+
+    def __call__(self, optimizer):
+        raise NotImplementedError
+
+
+class MaxEvaluations(Termination):
+    # Evaluation budget. The check runs between batches, so a run may overshoot by
+    # at most one batch.
+    reason = 'max_evaluations'
+
+    def __init__(self, max_evaluations):
+        self.max_evaluations = max_evaluations
+
+    def __call__(self, optimizer):
+        return optimizer.num_evaluations >= self.max_evaluations
+
+
+class Deadline(Termination):
+    # Wall-clock limit in seconds of running time, counted from the first check.
+    # Pickling (e.g. in a checkpoint) stores the seconds used so far rather than a
+    # monotonic timestamp, which means nothing on another host; the clock restarts
+    # at the first check after unpickling, so time spent pre-empted is not counted.
+    reason = 'deadline'
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.elapsed = 0.0
+        self.start = None
+
+    def __call__(self, optimizer):
+        now = time.monotonic()
+        if self.start is None:
+            self.start = now
+        return self.elapsed + now - self.start >= self.seconds
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if self.start is not None:
+            state['elapsed'] += time.monotonic() - self.start
+        state['start'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.start = None
+
+
+class TargetScore(Termination):
+    reason = 'target_score'
+
+    def __init__(self, target):
+        self.target = target
+
+    def __call__(self, optimizer):
+        return optimizer.best_score <= self.target
+
+
+class Stagnation(Termination):
+    # Stops when best_score has not improved by more than tolerance for window iterations
+    reason = 'stagnation'
+
+    def __init__(self, window, tolerance=0.0):
+        self.window = window
+        self.tolerance = tolerance
+        self.best_score = float('inf')
+        self.last_improvement = 0
+
+    def __call__(self, optimizer):
+        if optimizer.best_score < self.best_score - self.tolerance:
+            self.best_score = optimizer.best_score
+            self.last_improvement = optimizer.iteration
+        return optimizer.iteration - self.last_improvement >= self.window
+
+
+class LowDiversity(Termination):
+    # Stops when the population has collapsed: the mean per-coordinate standard
+    # deviation, relative to the domain width, falls below min_diversity.
+    # Single-solution engines (tabu search) never trigger it.
+    reason = 'diversity'
+
+    def __init__(self, min_diversity):
+        self.min_diversity = min_diversity
+
+    def __call__(self, optimizer):
+        solutions, _ = optimizer.population()
+        if solutions is None or len(solutions) < 2:
+            return False
+        width = np.maximum(optimizer.upper - optimizer.lower, np.finfo(float).tiny)
+        return (np.std(solutions, axis=0) / width).mean() < self.min_diversity
+
+
+def termination_criteria(max_evaluations=None, time_limit=None, target_score=None, stagnation=None, tolerance=0.0,
+                         min_diversity=None):
+    # Builds the rules for the given limits; None leaves a limit out
+    criteria = []
+    if max_evaluations is not None:
+        criteria.append(MaxEvaluations(max_evaluations))
+    if time_limit is not None:
+        criteria.append(Deadline(time_limit))
+    if target_score is not None:
+        criteria.append(TargetScore(target_score))
+    if stagnation is not None:
+        criteria.append(Stagnation(stagnation, tolerance))
+    if min_diversity is not None:
+        criteria.append(LowDiversity(min_diversity))
+    return criteria
@@ -0,0 +1,54 @@
+import numpy as np
+
+FIELDS = ('iteration', 'evaluations', 'best', 'mean', 'diversity')
+
+
+class ConvergenceTrace:
+    # Per-batch convergence history kept in preallocated ring buffers: the last
+    # capacity records survive, and every=k keeps only every k-th batch so long
+    # runs fit. Attach with Optimizer.trace = ConvergenceTrace(...); with no trace
+    # attached tell() skips recording entirely.
+    def __init__(self, capacity=10000, every=1):
+        self.capacity = capacity
+        self.every = every
+        self.iteration = np.zeros(capacity, dtype=np.int64)
+        self.evaluations = np.zeros(capacity, dtype=np.int64)
+        self.best = np.zeros(capacity)
+        self.mean = np.zeros(capacity)
+        self.diversity = np.zeros(capacity)
+        self.batches = 0
+        self.count = 0
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def record(self, optimizer, solutions, scores):
+        self.batches += 1
+        if (self.batches - 1) % self.every or len(scores) == 0:
+            return
+        index = self.count % self.capacity
+        self.iteration[index] = optimizer.iteration
+        self.evaluations[index] = optimizer.num_evaluations
+        self.best[index] = optimizer.best_score
+        self.mean[index] = np.mean(scores)
+        # Mean per-coordinate standard deviation of the batch
+        self.diversity[index] = np.std(solutions, axis=0).mean()
+        self.count += 1
+
+    def arrays(self):
+        # Records in chronological order
+        order = np.arange(self.count - len(self), self.count) % self.capacity
+        return {field: getattr(self, field)[order] for field in FIELDS}
+
+    def save(self, path):
+        np.savez(path, **self.arrays())
+
+    def to_csv(self, path):
+        arrays = self.arrays()
+        np.savetxt(path, np.column_stack([arrays[field] for field in FIELDS]), delimiter=',',
+                   header=','.join(FIELDS), comments='', fmt=['%d', '%d', '%.17g', '%.17g', '%.17g'])
+
+
+def load_trace(path):
+    with np.load(path) as data:
+        return {field: data[field] for field in FIELDS}
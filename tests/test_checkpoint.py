@@ -0,0 +1,60 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from metody_si.benchmarks import FUNCTIONS, as_batch
+from metody_si.checkpoint import load_checkpoint, resume
+from metody_si.experiments import ALGORITHMS, make_optimizer
+from metody_si.termination import Deadline
+from metody_si.trace import ConvergenceTrace
+
+
+class Preempted(Exception):
+    pass
+
+
+class PreemptedEvaluator:
+    # Scores num_batches batches, then fails as if the job were killed
+    def __init__(self, num_batches):
+        self.num_batches = num_batches
+        self.evaluate = as_batch(FUNCTIONS['ackley'])
+
+    def __call__(self, solutions):
+        if self.num_batches == 0:
+            raise Preempted
+        self.num_batches -= 1
+        return self.evaluate(solutions)
+
+
+@pytest.mark.parametrize('algorithm', list(ALGORITHMS))
+def test_resume_is_bit_for_bit(algorithm, tmp_path):
+    path = tmp_path / 'run.ckpt'
+    reference = make_optimizer(algorithm, 'ackley', 4, rng=3)
+    reference.trace = ConvergenceTrace()
+    reference.optimize()
+
+    interrupted = make_optimizer(algorithm, 'ackley', 4, rng=3)
+    interrupted.trace = ConvergenceTrace()
+    with pytest.raises(Preempted):
+        interrupted.optimize(PreemptedEvaluator(37), checkpoint=path, checkpoint_interval=0)
+    resumed = resume(path, checkpoint_interval=0)
+
+    assert resumed.best_score == reference.best_score
+    assert np.array_equal(resumed.best_solution, reference.best_solution)
+    assert resumed.num_evaluations == reference.num_evaluations
+    assert resumed.iteration == reference.iteration
+    assert np.array_equal(resumed.trace.arrays()['best'], reference.trace.arrays()['best'])
+    assert load_checkpoint(path).best_score == reference.best_score
+
+
+def test_deadline_survives_pickling():
+    deadline = Deadline(10)
+    deadline(None)
+    deadline.start -= 6  # Six seconds of running time
+    restored = pickle.loads(pickle.dumps(deadline))
+    assert restored.start is None
+    assert restored.elapsed == pytest.approx(6, abs=0.5)
+    assert not restored(None)
+    restored.seconds = 5
+    assert restored(None)
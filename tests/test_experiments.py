@@ -0,0 +1,14 @@
+from metody_si.experiments import experiment_grid, parse_params, run_experiment, summarize
+
+
+def test_list_params_expand_into_the_grid():
+    params = parse_params(['pso.num_particles=[10,20]', 'pso.max_iterations=5'])
+    tasks = list(experiment_grid(['pso'], ['ackley'], [2], range(2), params))
+    assert len(tasks) == 4
+    assert sorted(task['params']['num_particles'] for task in tasks) == [10, 10, 20, 20]
+    assert all(task['params']['max_iterations'] == 5 for task in tasks)
+
+    summary = summarize([run_experiment(task) for task in tasks])
+    assert [row['runs'] for row in summary] == [2, 2]
+    assert {row['params'] for row in summary} == {'{"max_iterations": 5, "num_particles": 10}',
+                                                  '{"max_iterations": 5, "num_particles": 20}'}
@@ -0,0 +1,32 @@
+import numpy as np
+
+from metody_si.benchmarks import ackley
+from metody_si.store import PersistentEvaluator
+
+
+def test_tolerances_share_a_file_without_collisions(tmp_path):
+    path = str(tmp_path / 'scores.db')
+    coarse = PersistentEvaluator(ackley.batch, path, tolerance=1.0)
+    fine = PersistentEvaluator(ackley.batch, path, tolerance=0.01)
+    exact = PersistentEvaluator(ackley.batch, path)
+
+    # Cell (3, 3) at width 1 and cell (3, 3) at width 0.01 hold different points
+    far = np.array([[3.5, 3.5]])
+    near = np.array([[0.035, 0.035]])
+    assert coarse(far)[0] == ackley.batch(far)[0]
+    assert fine(near)[0] == ackley.batch(near)[0]
+    assert fine.hits == 0
+
+    # Cell 0 and the exact coordinates 0.0 have the same bytes
+    origin = np.zeros((1, 2))
+    coarse(np.array([[0.5, 0.5]]))
+    assert exact(origin)[0] == ackley.batch(origin)[0]
+    assert exact.hits == 0
+
+    reopened = PersistentEvaluator(ackley.batch, path, tolerance=0.01)
+    assert reopened(near)[0] == ackley.batch(near)[0]
+    assert reopened.hits == 1
+    solutions, _ = reopened.best(10, 2)
+    assert len(solutions) == len(np.unique(solutions, axis=0))
+    for evaluator in (coarse, fine, exact, reopened):
+        evaluator.close()
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from metody_si.benchmarks import ackley
+from metody_si.tabu import TabuMemory, TabuSearch
+
+
+def brute_force(memory, solutions):
+    stored = memory.solutions[:memory.size]
+    if not len(stored):
+        return np.zeros(len(solutions), dtype=bool)
+    return (np.abs(solutions[:, np.newaxis, :] - stored).max(axis=2) <= memory.tolerance).any(axis=1)
+
+
+@pytest.mark.parametrize('dimensions', [1, 2, 3, 5, 10, 20, 30])
+@pytest.mark.parametrize('tolerance', [0.0, 1e-3, 0.05])
+@pytest.mark.parametrize('max_edge_probes', [TabuMemory.MAX_EDGE_PROBES, 1])
+def test_memory_matches_brute_force(dimensions, tolerance, max_edge_probes):
+    rng = np.random.default_rng(dimensions)
+    memory = TabuMemory(40, dimensions, tolerance)
+    memory.MAX_EDGE_PROBES = max_edge_probes  # 1 sends most queries through the full scan
+    for step in range(200):
+        if memory.size and step % 3 == 0:
+            center = memory.solutions[rng.integers(memory.size)]
+        else:
+            center = rng.uniform(-1, 1, dimensions)
+        if tolerance:
+            # Points on both sides of the tolerance radius, many of them near cell edges
+            solutions = center + rng.uniform(-2 * tolerance, 2 * tolerance, size=(20, dimensions))
+        else:
+            solutions = np.vstack([center, -0.0 * center, rng.uniform(-1, 1, size=(5, dimensions))])
+        assert np.array_equal(memory.contains(solutions), brute_force(memory, solutions))
+        memory.add(solutions[rng.integers(len(solutions))])
+    assert len(memory) == 40
+
+
+def test_zero_size_memory_is_never_tabu():
+    memory = TabuMemory(0, 2)
+    memory.add(np.zeros(2))
+    assert len(memory) == 0
+    assert np.zeros(2) not in memory
+
+    search = TabuSearch(ackley, [-5, 5], max_iterations=5, tabu_size=0, step_size=0.5, rng=0, dimensions=2)
+    search.optimize()
+    assert search.iteration == 5